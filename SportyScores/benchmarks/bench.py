@@ -0,0 +1,214 @@
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Keep benchmark ticks from touching the real tracking and archive databases
+os.environ.setdefault('TRACKING_DB_PATH', ':memory:')
+os.environ.setdefault('ARCHIVE_DB_PATH', ':memory:')
+
+from aiohttp import web
+from leagues import LEAGUES
+from sports_api import SportsAPI, decode_scoreboard
+from bot_commands import EmbedRenderCache, create_game_embed, format_score_breakdown
+from fixtures import FIXTURE_DIR, LEAGUE_SHAPES, fixture_path, leagues, scoreboard_bytes
+
+class FakeChannel:
+    def __init__(self, channel_id: int):
+        self.id = channel_id
+
+class FakeMessage:
+    def __init__(self, message_id: int, channel_id: int):
+        self.id = message_id
+        self.channel = FakeChannel(channel_id)
+        self.guild = None
+        self.edits = 0
+    
+    async def edit(self, embed=None, **kwargs):
+        self.edits += 1
+        return self
+
+def percentile(samples: List[float], pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+def summarize(stage: str, slate: str, league: str, events: int, samples_ns: List[int], peak_bytes: int) -> Dict:
+    samples_ms = [s / 1e6 for s in samples_ns]
+    mean_ms = sum(samples_ms) / len(samples_ms)
+    return {
+        'stage': stage,
+        'slate': slate,
+        'league': league,
+        'events': events,
+        'iterations': len(samples_ms),
+        'mean_ms': round(mean_ms, 4),
+        'p50_ms': round(percentile(samples_ms, 50), 4),
+        'p90_ms': round(percentile(samples_ms, 90), 4),
+        'p99_ms': round(percentile(samples_ms, 99), 4),
+        'events_per_sec': round(events / (mean_ms / 1000), 1) if mean_ms else None,
+        'peak_alloc_kib': round(peak_bytes / 1024, 1)
+    }
+
+def measure(fn: Callable[[], object], iterations: int) -> tuple:
+    # Allocation tracing distorts timings, so take it from a separate pass
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter_ns()
+        fn()
+        samples.append(time.perf_counter_ns() - start)
+    return samples, peak
+
+def bench_stages(league: str, events: int, slate: str, iterations: int) -> List[Dict]:
+    api = SportsAPI()
+    body = scoreboard_bytes(league, events)
+    data = decode_scoreboard(body)
+    games = api._parse_events(data, league)
+    count = len(games)
+    render_cache = EmbedRenderCache()
+    
+    stages = {
+        'decode': lambda: decode_scoreboard(body),
+        'parse_games': lambda: api._parse_events(data, league),
+        'create_game_embed': lambda: [create_game_embed(game, league) for game in games],
+        'render_game_embed_cached': lambda: [render_cache.render(game, league) for game in games],
+        'format_score_breakdown': lambda: [format_score_breakdown(game, league) for game in games]
+    }
+    
+    results = []
+    for stage, fn in stages.items():
+        samples, peak = measure(fn, iterations)
+        results.append(summarize(stage, slate, league, count, samples, peak))
+    return results
+
+async def bench_tick(events: int, slate: str, ticks: int, channels: int) -> Dict:
+    import main as bot_main
+    
+    tick = {'seed': 0}
+    
+    async def scoreboard(request):
+        league = request.match_info['league']
+        return web.Response(body=scoreboard_bytes(league, events or LEAGUE_SHAPES[league]['slate'], tick['seed']), content_type='application/json')
+    
+    app = web.Application()
+    app.router.add_get('/{sport}/{league}/scoreboard', scoreboard)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    port = runner.addresses[0][1]
+    
+    original_base = bot_main.sports_api.base_url
+    bot_main.sports_api.base_url = f'http://127.0.0.1:{port}'
+    bot_main.edit_scheduler.channel_interval = 0
+    
+    bot_main.game_tracker.clear()
+    messages = []
+    tracked = 0
+    for league in leagues():
+        data = decode_scoreboard(scoreboard_bytes(league, events or LEAGUE_SHAPES[league]['slate']))
+        for game in bot_main.sports_api._parse_events(data, league):
+            if game.completed:
+                continue
+            message = FakeMessage(len(messages) + 1, len(messages) % channels)
+            messages.append(message)
+            bot_main.game_tracker.add_tracked_message(game.id, message, league)
+            tracked += 1
+    
+    samples = []
+    peak = 0
+    try:
+        for i in range(ticks + 1):
+            tick['seed'] = i
+            bot_main.sports_api.invalidate()
+            bot_main.poll_scheduler.reset()
+            trace = i == 0
+            if trace:
+                tracemalloc.start()
+            start = time.perf_counter_ns()
+            with contextlib.redirect_stdout(io.StringIO()):
+                await bot_main.update_scores()
+                await bot_main.edit_scheduler.drain()
+            elapsed = time.perf_counter_ns() - start
+            if trace:
+                _, peak = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+            else:
+                samples.append(elapsed)
+    finally:
+        bot_main.sports_api.base_url = original_base
+        await bot_main.sports_api.close_session()
+        await runner.cleanup()
+    
+    result = summarize('update_scores_tick', slate, 'all', tracked, samples, peak)
+    result['edits'] = sum(message.edits for message in messages)
+    result['channels'] = channels
+    return result
+
+async def record_fixtures():
+    os.makedirs(FIXTURE_DIR, exist_ok=True)
+    api = SportsAPI()
+    await api.create_session()
+    try:
+        for league in leagues():
+            async with api.session.get(LEAGUES[league].endpoint(api.base_url)) as response:
+                response.raise_for_status()
+                body = await response.read()
+            with open(fixture_path(league), 'wb') as f:
+                f.write(body)
+            print(f"Recorded {league.upper()} scoreboard ({len(body)} bytes)")
+    finally:
+        await api.close_session()
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark scoreboard parsing, rendering and update ticks')
+    parser.add_argument('--iterations', type=int, default=50)
+    parser.add_argument('--ticks', type=int, default=10)
+    parser.add_argument('--stress', type=int, default=300, help='events per league in the stress slate (0 to skip)')
+    parser.add_argument('--channels', type=int, default=8)
+    parser.add_argument('--output', help='write JSON results to this file instead of stdout')
+    parser.add_argument('--record', action='store_true', help='record live ESPN scoreboards as fixtures and exit')
+    args = parser.parse_args()
+    
+    if args.record:
+        asyncio.run(record_fixtures())
+        return
+    
+    slates = [('slate', 0)]
+    if args.stress:
+        slates.append(('stress', args.stress))
+    
+    results = []
+    for slate, events in slates:
+        for league in leagues():
+            results.extend(bench_stages(league, events, slate, args.iterations))
+        results.append(asyncio.run(bench_tick(events, slate, args.ticks, args.channels)))
+    
+    report = {
+        'python': platform.python_version(),
+        'iterations': args.iterations,
+        'ticks': args.ticks,
+        'results': results
+    }
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(output)
+    else:
+        print(output)
+
+if __name__ == '__main__':
+    main()
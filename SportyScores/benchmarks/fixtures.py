@@ -0,0 +1,130 @@
+import json
+import os
+import random
+from typing import Dict, List
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+LEAGUE_SHAPES = {
+    'nfl': {'periods': 4, 'max_period_score': 14, 'stats': 12, 'slate': 14},
+    'mlb': {'periods': 9, 'max_period_score': 3, 'stats': 18, 'slate': 15},
+    'nba': {'periods': 4, 'max_period_score': 38, 'stats': 15, 'slate': 12},
+    'nhl': {'periods': 3, 'max_period_score': 2, 'stats': 10, 'slate': 13}
+}
+
+STATES = ('pre', 'in', 'in', 'in', 'post')
+# GameTracker keys games by id alone, so each league gets its own id range like real ESPN ids
+EVENT_ID_BASE = {league: 400000000 + 10000000 * position for position, league in enumerate(LEAGUE_SHAPES)}
+
+def fixture_path(league: str) -> str:
+    return os.path.join(FIXTURE_DIR, f'{league}.json')
+
+def load_recorded(league: str) -> bytes:
+    path = fixture_path(league)
+    if not os.path.exists(path):
+        return b''
+    with open(path, 'rb') as f:
+        return f.read()
+
+def _competitor(rng: random.Random, league: str, home_away: str, team_id: int, periods: int) -> Dict:
+    shape = LEAGUE_SHAPES[league]
+    linescores = [{'value': rng.randint(0, shape['max_period_score'])} for _ in range(periods)]
+    return {
+        'id': str(team_id),
+        'homeAway': home_away,
+        'score': str(sum(line['value'] for line in linescores)),
+        'team': {
+            'id': str(team_id),
+            'displayName': f'City{team_id} Team{team_id}',
+            'shortDisplayName': f'Team{team_id}',
+            'abbreviation': f'T{team_id:02d}'[:4],
+            'color': f'{rng.randrange(0x1000000):06x}',
+            'logo': f'https://a.espncdn.com/i/teamlogos/{league}/500/{team_id}.png',
+            'links': [{'href': f'https://www.espn.com/{league}/team/_/id/{team_id}'} for _ in range(4)]
+        },
+        'linescores': linescores,
+        'records': [{'summary': f'{rng.randint(0, 60)}-{rng.randint(0, 60)}'}],
+        'statistics': [
+            {'name': f'stat{i}', 'abbreviation': f'S{i}', 'displayValue': str(rng.randint(0, 500))}
+            for i in range(shape['stats'])
+        ],
+        'leaders': [
+            {'name': f'leader{i}', 'leaders': [{'displayValue': str(rng.randint(0, 200)), 'athlete': {'displayName': f'Player {i}'}}]}
+            for i in range(3)
+        ]
+    }
+
+def _event(rng: random.Random, league: str, index: int) -> Dict:
+    shape = LEAGUE_SHAPES[league]
+    state = STATES[index % len(STATES)]
+    if state == 'pre':
+        period, periods = 0, 0
+    elif state == 'in':
+        period = rng.randint(1, shape['periods'])
+        periods = period
+    else:
+        period, periods = shape['periods'], shape['periods']
+    
+    clock = rng.randint(0, 900)
+    event_id = str(EVENT_ID_BASE[league] + index)
+    return {
+        'id': event_id,
+        'name': f'Away {index} at Home {index}',
+        'shortName': f'A{index} @ H{index}',
+        'date': f'2026-10-18T{17 + index % 6:02d}:00Z',
+        'competitions': [{
+            'id': event_id,
+            'status': {
+                'clock': clock,
+                'displayClock': f'{clock // 60}:{clock % 60:02d}',
+                'period': period,
+                'type': {
+                    'name': {'pre': 'STATUS_SCHEDULED', 'in': 'STATUS_IN_PROGRESS', 'post': 'STATUS_FINAL'}[state],
+                    'state': state,
+                    'completed': state == 'post',
+                    'description': {'pre': 'Scheduled', 'in': 'In Progress', 'post': 'Final'}[state],
+                    'detail': {'pre': 'Sun, October 18th at 1:00 PM EDT', 'in': f'{clock // 60}:{clock % 60:02d} - {period}', 'post': 'Final'}[state]
+                }
+            },
+            'competitors': [
+                _competitor(rng, league, 'home', 2 * index + 1, periods),
+                _competitor(rng, league, 'away', 2 * index + 2, periods)
+            ],
+            'venue': {'fullName': f'Stadium {index}', 'address': {'city': 'City', 'state': 'ST'}},
+            'broadcasts': [{'market': 'national', 'names': ['ESPN']}],
+            'odds': [{'details': f'T{index} -3.5', 'overUnder': 47.5, 'provider': {'name': 'Book'}}],
+            'situation': {
+                'possession': str(2 * index + 1),
+                'downDistanceText': '3rd & 4 at OPP 35',
+                'possessionText': 'OPP 35',
+                'balls': 1,
+                'strikes': 2,
+                'outs': 1,
+                'onFirst': True,
+                'batter': {'athlete': {'displayName': f'Batter {index}'}}
+            } if state == 'in' else {},
+            'attendance': rng.randint(10000, 80000),
+            'headlines': [{'description': 'x' * 200, 'shortLinkText': 'y' * 80}]
+        }],
+        'links': [{'href': f'https://www.espn.com/{league}/game/_/gameId/{index}'} for _ in range(6)]
+    }
+
+def synthetic_scoreboard(league: str, events: int, seed: int = 0) -> Dict:
+    rng = random.Random(f'{league}:{seed}')
+    return {
+        'leagues': [{'id': league, 'name': league.upper(), 'calendar': [{'label': f'Week {i}'} for i in range(20)]}],
+        'season': {'type': 2, 'year': 2026},
+        'events': [_event(rng, league, i) for i in range(events)]
+    }
+
+def scoreboard_bytes(league: str, events: int = 0, seed: int = 0) -> bytes:
+    # A normal slate prefers a scoreboard recorded with `bench.py --record`; stress slates are always synthetic
+    if not events:
+        recorded = load_recorded(league) if seed == 0 else b''
+        if recorded:
+            return recorded
+        events = LEAGUE_SHAPES[league]['slate']
+    return json.dumps(synthetic_scoreboard(league, events, seed)).encode()
+
+def leagues() -> List[str]:
+    return list(LEAGUE_SHAPES)
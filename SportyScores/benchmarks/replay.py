@@ -0,0 +1,126 @@
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import os
+import sys
+import time
+from types import SimpleNamespace
+from typing import Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Keep replays from touching the real tracking and archive databases
+os.environ.setdefault('TRACKING_DB_PATH', ':memory:')
+os.environ.setdefault('ARCHIVE_DB_PATH', ':memory:')
+
+from config import POLL_TICK, EDIT_CHANNEL_INTERVAL
+from recording import ReplaySportsAPI, SnapshotRecorder
+from bot_commands import ScoreCommands
+from bench import FakeChannel, FakeMessage, summarize
+from fixtures import leagues, scoreboard_bytes
+from sports_api import decode_scoreboard
+
+class FakeBot:
+    def __init__(self):
+        self.user = SimpleNamespace(display_avatar=SimpleNamespace(url='https://example.invalid/avatar.png'))
+
+class FakeContext:
+    def __init__(self, channel_id: int):
+        self.channel = FakeChannel(channel_id)
+        self.guild = None
+        self.sent: List[FakeMessage] = []
+    
+    async def send(self, embed=None, embeds=None, **kwargs):
+        message = FakeMessage(len(self.sent) + 1, self.channel.id)
+        self.sent.append(message)
+        return message
+
+def synthesize(directory: str, minutes: int, interval: float) -> str:
+    # A busy night from the synthetic fixtures: every league changes every `interval` seconds
+    recorder = SnapshotRecorder(directory)
+    start = time.time() - minutes * 60
+    for step in range(int(minutes * 60 / interval)):
+        for league in leagues():
+            recorder.record(league, decode_scoreboard(scoreboard_bytes(league, 0, step)), start + step * interval)
+    recorder.close()
+    return recorder.path
+
+async def replay(path: str, speed: float, channels: int, commands_per_tick: int) -> Dict:
+    import main as bot_main
+    
+    api = ReplaySportsAPI(path, speed)
+    bot_main.sports_api = api
+    bot_main.poll_scheduler.reset()
+    bot_main.poll_scheduler.clock = bot_main.poll_scheduler.wall_clock = api.clock
+    bot_main.edit_scheduler.channel_interval = EDIT_CHANNEL_INTERVAL / speed
+    
+    # Track every unfinished game from the opening scoreboards, spread across fake channels
+    bot_main.game_tracker.clear()
+    messages = []
+    for league in api.timelines:
+        for game in api.parse_games(api.snapshot_at(league, api.start), league):
+            if game.completed:
+                continue
+            message = FakeMessage(len(messages) + 1, len(messages) % channels)
+            messages.append(message)
+            bot_main.game_tracker.add_tracked_message(game.id, message, league)
+    tracked = len(messages)
+    
+    cog = ScoreCommands(FakeBot(), api, bot_main.game_tracker)
+    tick_samples = []
+    command_samples = []
+    api.clock.restart()
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        while not api.finished:
+            tick_start = time.perf_counter_ns()
+            await bot_main.update_scores()
+            tick_samples.append(time.perf_counter_ns() - tick_start)
+            
+            for i in range(commands_per_tick):
+                command_start = time.perf_counter_ns()
+                await cog.scores.callback(cog, FakeContext(i % channels))
+                command_samples.append(time.perf_counter_ns() - command_start)
+            
+            elapsed = (time.perf_counter_ns() - tick_start) / 1e9
+            await asyncio.sleep(max(0, POLL_TICK / speed - elapsed))
+        await bot_main.edit_scheduler.drain()
+    
+    results = [summarize('replay_tick', 'replay', 'all', tracked, tick_samples, 0)]
+    if command_samples:
+        results.append(summarize('scores_command', 'replay', 'all', commands_per_tick, command_samples, 0))
+    return {
+        'recording': path,
+        'speed': speed,
+        'recorded_seconds': round(api.end - api.start, 1),
+        'wall_seconds': round(time.perf_counter() - started, 2),
+        'tracked': tracked,
+        'edits': sum(message.edits for message in messages),
+        'edit_stats': bot_main.edit_scheduler.stats(),
+        'results': results
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description='Replay recorded scoreboards through update_scores against a fake Discord sink')
+    parser.add_argument('path', help='recording file or directory (RECORD_DIR from a live run)')
+    parser.add_argument('--speed', type=float, default=100)
+    parser.add_argument('--channels', type=int, default=8)
+    parser.add_argument('--commands', type=int, default=0, help='!scores invocations to run alongside each tick')
+    parser.add_argument('--synthesize', type=int, metavar='MINUTES', help='first write a synthetic recording of this many minutes into path')
+    parser.add_argument('--output', help='write JSON results to this file instead of stdout')
+    args = parser.parse_args()
+    
+    if args.synthesize:
+        synthesize(args.path, args.synthesize, POLL_TICK)
+    
+    report = asyncio.run(replay(args.path, args.speed, args.channels, args.commands))
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(output)
+    else:
+        print(output)
+
+if __name__ == '__main__':
+    main()
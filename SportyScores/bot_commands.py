@@ -1,43 +1,235 @@
+import time
 import discord
+from discord import app_commands
 from discord.ext import commands
-from typing import Dict, List
-from config import LEAGUE_COLORS, LEAGUE_NAMES
+from collections import OrderedDict
+from datetime import date, datetime, timedelta
+from typing import Callable, Dict, List, Optional, Set, Tuple
+from config import MAX_EMBEDS_PER_MESSAGE, EMBED_BATCH_CHAR_LIMIT, EMBED_CACHE_SIZE, HISTORY_MAX_DAYS, MISSING_GAME_TTL
+from models import Game, MessageGroup, Subscription, fingerprint
+from leagues import LEAGUES, SUPPORTED_LEAGUES, LEAGUE_LIST_TEXT, LEAGUE_BULLETS_TEXT
+from tracking_store import TrackingStore
+from follows import Follow, FollowScheduler
+from metrics import REGISTRY
+from sports_api import espn_today
+
+TRACKING_CHANGES = REGISTRY.counter('sportyscores_tracking_changes_total', 'Game subscriptions added to or removed from tracking', ('league', 'action'))
+COMMANDS = REGISTRY.counter('sportyscores_commands_total', 'Sports commands invoked, by outcome', ('command', 'outcome'))
+COMMAND_SECONDS = REGISTRY.histogram('sportyscores_command_seconds', 'Sports command latency from invoke to reply', ('command',))
 
 class GameTracker:
-    def __init__(self):
-        self.tracked_messages: Dict[str, Dict] = {}
-    
-    def add_tracked_message(self, game_id: str, message: discord.Message, league: str):
-        self.tracked_messages[game_id] = {
-            'message': message,
-            'league': league,
-            'last_score': None
-        }
-    
-    def remove_tracked_message(self, game_id: str):
-        if game_id in self.tracked_messages:
-            del self.tracked_messages[game_id]
-    
-    def get_tracked_games(self) -> Dict[str, Dict]:
-        return self.tracked_messages
-    
-    def update_last_score(self, game_id: str, score: str):
-        if game_id in self.tracked_messages:
-            self.tracked_messages[game_id]['last_score'] = score
+    def __init__(self, store: Optional[TrackingStore] = None):
+        self.subscriptions: Dict[Tuple[str, int], Subscription] = {}
+        self.by_game: Dict[str, Set[Tuple[str, int]]] = {}
+        self.by_guild: Dict[Optional[int], Set[Tuple[str, int]]] = {}
+        self.by_channel: Dict[int, Set[Tuple[str, int]]] = {}
+        self.groups: Dict[int, MessageGroup] = {}
+        # game_id -> when it was first polled and not found on its league's scoreboard
+        self.missing_since: Dict[str, float] = {}
+        self.store = store
+    
+    def __len__(self) -> int:
+        return len(self.subscriptions)
+    
+    def add_tracked_message(self, game_id: str, message: discord.Message, league: str, slot: int = 0,
+                            embed: Optional[discord.Embed] = None, fingerprint: Optional[str] = None,
+                            detailed: bool = False) -> Subscription:
+        guild = getattr(message, 'guild', None)
+        subscription = Subscription(
+            game_id=game_id,
+            league=league,
+            guild_id=guild.id if guild else None,
+            channel_id=message.channel.id,
+            message=message,
+            slot=slot,
+            fingerprint=fingerprint,
+            detailed=detailed
+        )
+        self._index(subscription)
+        self.groups[message.id].set_embed(slot, embed)
+        self._persist(subscription)
+        TRACKING_CHANGES.labels(league, 'added').inc()
+        return subscription
+    
+    def _index(self, subscription: Subscription):
+        key = subscription.key
+        if key in self.subscriptions:
+            self._unindex(self.subscriptions[key])
+        self.subscriptions[key] = subscription
+        self.by_game.setdefault(subscription.game_id, set()).add(key)
+        self.by_guild.setdefault(subscription.guild_id, set()).add(key)
+        self.by_channel.setdefault(subscription.channel_id, set()).add(key)
+        group = self.groups.get(subscription.message.id)
+        if group is None:
+            group = self.groups[subscription.message.id] = MessageGroup(message=subscription.message)
+        group.keys.add(key)
+    
+    def _unindex(self, subscription: Subscription):
+        key = subscription.key
+        del self.subscriptions[key]
+        for index, index_key in (
+            (self.by_game, subscription.game_id),
+            (self.by_guild, subscription.guild_id),
+            (self.by_channel, subscription.channel_id)
+        ):
+            keys = index.get(index_key)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del index[index_key]
+        if subscription.game_id not in self.by_game:
+            self.missing_since.pop(subscription.game_id, None)
+        group = self.groups.get(subscription.message.id)
+        if group is not None:
+            group.keys.discard(key)
+            if not group.keys:
+                del self.groups[subscription.message.id]
+    
+    def remove_subscription(self, subscription: Subscription) -> bool:
+        # Identity check so a stale callback cannot remove a newer subscription for the same message
+        if self.subscriptions.get(subscription.key) is not subscription:
+            return False
+        self._unindex(subscription)
+        if self.store:
+            self.store.delete(subscription.game_id, subscription.message.id)
+        TRACKING_CHANGES.labels(subscription.league, 'removed').inc()
+        return True
+    
+    def _remove_keys(self, keys) -> int:
+        return sum(self.remove_subscription(self.subscriptions[key]) for key in list(keys))
+    
+    def remove_tracked_message(self, game_id: str) -> int:
+        return self._remove_keys(self.by_game.get(game_id, ()))
+    
+    def stop_guild(self, guild_id: Optional[int]) -> int:
+        return self._remove_keys(self.by_guild.get(guild_id, ()))
+    
+    def stop_channel(self, channel_id: int) -> int:
+        return self._remove_keys(self.by_channel.get(channel_id, ()))
+    
+    def clear(self) -> int:
+        return self._remove_keys(self.subscriptions)
+    
+    def is_tracked_in(self, game_id: str, channel_id: int) -> bool:
+        game_keys = self.by_game.get(game_id)
+        channel_keys = self.by_channel.get(channel_id)
+        if not game_keys or not channel_keys:
+            return False
+        return not game_keys.isdisjoint(channel_keys)
+    
+    def channel_count(self, channel_id: int) -> int:
+        return len(self.by_channel.get(channel_id, ()))
+    
+    def group_for(self, subscription: Subscription) -> Optional[MessageGroup]:
+        return self.groups.get(subscription.message.id)
+    
+    def subscriptions_in(self, group: MessageGroup) -> List[Subscription]:
+        return sorted((self.subscriptions[key] for key in group.keys), key=lambda s: s.slot)
+    
+    def subscriptions_for(self, game_id: str) -> List[Subscription]:
+        return [self.subscriptions[key] for key in self.by_game.get(game_id, ())]
+    
+    def games_by_league(self) -> Dict[str, List[str]]:
+        leagues: Dict[str, List[str]] = {}
+        for game_id, keys in self.by_game.items():
+            league = self.subscriptions[next(iter(keys))].league
+            leagues.setdefault(league, []).append(game_id)
+        return leagues
+    
+    def expire_missing(self, game_ids: List[str], present: Dict[str, Game], now: float) -> List[str]:
+        # Postponed games and games from a day the scoreboard has rolled past never complete,
+        # so they are dropped once they have been missing for MISSING_GAME_TTL seconds
+        expired = []
+        for game_id in game_ids:
+            if game_id in present:
+                self.missing_since.pop(game_id, None)
+                continue
+            since = self.missing_since.setdefault(game_id, now)
+            if now - since >= MISSING_GAME_TTL:
+                expired.append(game_id)
+        return expired
+    
+    def update_game_state(self, subscription: Subscription, game: Game, state: Optional[Tuple] = None):
+        if state is None:
+            state = detailed_render_state(game, subscription.league) if subscription.detailed else game.render_state()
+        subscription.state = state
+        subscription.fingerprint = fingerprint(subscription.state)
+        self._persist(subscription)
+    
+    def clear_game_state(self, subscription: Subscription):
+        subscription.state = None
+        subscription.finalizing = False
+        subscription.fingerprint = None
+        self._persist(subscription)
+    
+    def _persist(self, subscription: Subscription):
+        if self.store and self.subscriptions.get(subscription.key) is subscription:
+            self.store.upsert(
+                subscription.game_id, subscription.message.id, subscription.channel_id,
+                subscription.guild_id, subscription.slot, subscription.league, subscription.fingerprint,
+                subscription.detailed
+            )
+    
+    def restore(self, bot: commands.Bot, owns_guild: Optional[Callable[[Optional[int]], bool]] = None) -> int:
+        if not self.store:
+            return 0
+        
+        restored = 0
+        for row in self.store.load():
+            if (row['game_id'], row['message_id']) in self.subscriptions:
+                continue
+            if owns_guild and not owns_guild(row['guild_id']):
+                continue
+            # Partial messages can be edited without fetching each message from Discord first
+            channel = bot.get_partial_messageable(row['channel_id'], guild_id=row['guild_id'])
+            message = channel.get_partial_message(row['message_id'])
+            subscription = Subscription(
+                game_id=row['game_id'],
+                league=row['league'],
+                guild_id=row['guild_id'],
+                channel_id=row['channel_id'],
+                message=message,
+                slot=row['slot'],
+                fingerprint=row['fingerprint'],
+                detailed=row['detailed']
+            )
+            self._index(subscription)
+            # The other embeds in this message are unknown until it is fetched on its first edit
+            self.groups[message.id].hydrated = False
+            restored += 1
+        return restored
+
+def pack_embeds(embeds: List[discord.Embed]) -> List[List[discord.Embed]]:
+    batches: List[List[discord.Embed]] = []
+    batch: List[discord.Embed] = []
+    batch_chars = 0
+    
+    for embed in embeds:
+        size = len(embed)
+        if batch and (len(batch) >= MAX_EMBEDS_PER_MESSAGE or batch_chars + size > EMBED_BATCH_CHAR_LIMIT):
+            batches.append(batch)
+            batch = []
+            batch_chars = 0
+        batch.append(embed)
+        batch_chars += size
+    
+    if batch:
+        batches.append(batch)
+    return batches
 
-def create_game_embed(game: Dict, league: str, bot_user=None) -> discord.Embed:
-    color = LEAGUE_COLORS.get(league, 0x000000)
-    league_name = LEAGUE_NAMES.get(league, league.upper())
+def create_game_embed(game: Game, league: str, bot_user=None) -> discord.Embed:
+    league_info = LEAGUES.get(league)
+    color = league_info.color if league_info else 0x000000
+    league_name = league_info.name if league_info else league.upper()
     
     try:
-        team_color = f"0x{game['home_team_color']}" if game.get('home_team_color') else None
-        if team_color and len(game['home_team_color']) == 6:
-            color = int(game['home_team_color'], 16)
-    except:
+        if game.home_team_color and len(game.home_team_color) == 6:
+            color = int(game.home_team_color, 16)
+    except ValueError:
         pass
     
-    status_emoji = "🔴" if not game['completed'] and game['period'] > 0 else ("✅" if game['completed'] else "⏰")
-    title = f"{status_emoji} {game['away_team_abbr']} @ {game['home_team_abbr']}"
+    status_emoji = "🔴" if not game.completed and game.period > 0 else ("✅" if game.completed else "⏰")
+    title = f"{status_emoji} {game.away_team_abbr} @ {game.home_team_abbr}"
     
     embed = discord.Embed(
         title=title,
@@ -50,19 +242,19 @@ def create_game_embed(game: Dict, league: str, bot_user=None) -> discord.Embed:
             icon_url=bot_user.display_avatar.url
         )
     
-    away_abbr = game['away_team_abbr'] or game['away_team'][:3].upper()
-    home_abbr = game['home_team_abbr'] or game['home_team'][:3].upper()
-    score_text = f"**{away_abbr}** {game['away_score']} - {game['home_score']} **{home_abbr}**"
+    away_abbr = game.away_team_abbr or game.away_team[:3].upper()
+    home_abbr = game.home_team_abbr or game.home_team[:3].upper()
+    score_text = f"**{away_abbr}** {game.away_score} - {game.home_score} **{home_abbr}**"
     embed.add_field(name="Score", value=score_text, inline=True)
     
-    status_text = game['detail']
-    if game['period'] > 0 and not game['completed'] and game['clock']:
-        period_name = get_period_name(league, game['period'])
-        status_text = f"{period_name} - {game['clock']}"
+    status_text = game.detail
+    if game.period > 0 and not game.completed and game.clock:
+        period_name = get_period_name(league, game.period)
+        status_text = f"{period_name} - {game.clock}"
     embed.add_field(name="Status", value=status_text, inline=True)
     
-    if game['home_record'] or game['away_record']:
-        records = f"{game['away_record']} / {game['home_record']}"
+    if game.home_record or game.away_record:
+        records = f"{game.away_record} / {game.home_record}"
         embed.add_field(name="Records", value=records, inline=True)
     
     footer_text = f"Blazed A.I • {league_name}"
@@ -73,27 +265,124 @@ def create_game_embed(game: Dict, league: str, bot_user=None) -> discord.Embed:
     
     return embed
 
-def format_score_breakdown(game: Dict, league: str) -> str:
-    away_score = game['away_score']
-    home_score = game['home_score']
-    away_team = game['away_team_abbr'] or game['away_team'][:3].upper()
-    home_team = game['home_team_abbr'] or game['home_team'][:3].upper()
+def parse_day(text: str, today: date) -> Optional[date]:
+    text = text.lower()
+    if text == 'today':
+        return today
+    if text == 'yesterday':
+        return today - timedelta(days=1)
+    if text == 'tomorrow':
+        return today + timedelta(days=1)
+    for pattern in ('%Y-%m-%d', '%Y%m%d'):
+        try:
+            return datetime.strptime(text, pattern).date()
+        except ValueError:
+            continue
+    return None
+
+def parse_dates(text: str, today: date) -> Optional[List[date]]:
+    # "yesterday", "2026-10-12" or an inclusive range like "2026-10-10..2026-10-12"
+    first, _, last = text.partition('..')
+    start = parse_day(first, today)
+    end = parse_day(last, today) if last else start
+    if start is None or end is None or end < start:
+        return None
+    return [start + timedelta(days=i) for i in range((end - start).days + 1)]
+
+def create_day_embed(games: List[Game], league: str, day: date, bot_user=None) -> discord.Embed:
+    league_info = LEAGUES.get(league)
+    league_name = league_info.name if league_info else league.upper()
+    
+    lines = []
+    for game in games:
+        away_abbr = game.away_team_abbr or game.away_team[:3].upper()
+        home_abbr = game.home_team_abbr or game.home_team[:3].upper()
+        if game.completed:
+            lines.append(f"✅ **{away_abbr}** {game.away_score} - {game.home_score} **{home_abbr}** · {game.detail}")
+        else:
+            lines.append(f"⏰ **{away_abbr}** @ **{home_abbr}** · {game.detail}")
+    
+    description = "\n".join(lines)
+    if len(description) > 4000:
+        description = description[:description.rfind("\n", 0, 4000)] + "\n…"
+    
+    embed = discord.Embed(
+        title=f"{league_name} · {day.strftime('%a, %b %d %Y')}",
+        description=description,
+        color=league_info.color if league_info else 0x000000
+    )
+    
+    if bot_user:
+        embed.set_author(
+            name="Blazed A.I Sports Tracker",
+            icon_url=bot_user.display_avatar.url
+        )
+    
+    embed.set_footer(
+        text=f"Blazed A.I • {league_name}",
+        icon_url=bot_user.display_avatar.url if bot_user else None
+    )
+    
+    return embed
+
+class EmbedRenderCache:
+    def __init__(self, max_size: int = EMBED_CACHE_SIZE):
+        self.max_size = max_size
+        self._embeds: OrderedDict[Tuple, discord.Embed] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+    
+    def __len__(self) -> int:
+        return len(self._embeds)
+    
+    def render(self, game: Game, league: str, bot_user=None, state: Optional[Tuple] = None) -> discord.Embed:
+        avatar_url = bot_user.display_avatar.url if bot_user else None
+        key = (league, state or game.render_state(), avatar_url)
+        
+        # Cached embeds are shared between every message showing this state, so callers must not mutate them
+        embed = self._embeds.get(key)
+        if embed is not None:
+            self.hits += 1
+            self._embeds.move_to_end(key)
+            return embed
+        
+        self.misses += 1
+        embed = create_game_embed(game, league, bot_user)
+        self._embeds[key] = embed
+        if len(self._embeds) > self.max_size:
+            self._embeds.popitem(last=False)
+        return embed
+    
+    def payload(self, game: Game, league: str, bot_user=None, state: Optional[Tuple] = None) -> Dict:
+        return self.render(game, league, bot_user, state).to_dict()
+    
+    def stats(self) -> Dict[str, int]:
+        return {'size': len(self._embeds), 'hits': self.hits, 'misses': self.misses}
+
+embed_cache = EmbedRenderCache()
+
+REGISTRY.counter(
+    'sportyscores_embed_cache_total', 'Embed render cache lookups', ('result',),
+    function=lambda: {('hit',): embed_cache.hits, ('miss',): embed_cache.misses}
+)
+
+def render_game_embed(game: Game, league: str, bot_user=None, state: Optional[Tuple] = None) -> discord.Embed:
+    return embed_cache.render(game, league, bot_user, state)
+
+def format_score_breakdown(game: Game, league: str) -> str:
+    away_score = game.away_score
+    home_score = game.home_score
+    away_team = game.away_team_abbr or game.away_team[:3].upper()
+    home_team = game.home_team_abbr or game.home_team[:3].upper()
     
     score_display = f"```\n"
     
-    if game.get('away_linescores') and len(game['away_linescores']) > 0:
-        period_labels = []
-        if league == 'nfl':
-            period_labels = ['Q1', 'Q2', 'Q3', 'Q4'] + [f'OT{i}' for i in range(1, 6)]
-        elif league == 'nba':
-            period_labels = ['Q1', 'Q2', 'Q3', 'Q4'] + [f'OT{i}' for i in range(1, 6)]
-        elif league == 'nhl':
-            period_labels = ['P1', 'P2', 'P3', 'OT', 'SO']
-        elif league == 'mlb':
-            period_labels = [f'{i}' for i in range(1, 20)]
+    if game.away_linescores:
+        league_info = LEAGUES.get(league)
+        period_labels = league_info.period_labels if league_info else ()
         
         header = f"{'Team':<6}"
-        for i, _ in enumerate(game['away_linescores']):
+        for i, _ in enumerate(game.away_linescores):
             if i < len(period_labels):
                 header += f" {period_labels[i]:>3}"
         header += f" {'Total':>5}"
@@ -101,13 +390,13 @@ def format_score_breakdown(game: Dict, league: str) -> str:
         score_display += f"{'-' * len(header)}\n"
         
         away_line = f"{away_team:<6}"
-        for score in game['away_linescores']:
+        for score in game.away_linescores:
             away_line += f" {score.get('value', '-'):>3}"
         away_line += f" {away_score:>5}"
         score_display += f"{away_line}\n"
         
         home_line = f"{home_team:<6}"
-        for score in game['home_linescores']:
+        for score in game.home_linescores:
             home_line += f" {score.get('value', '-'):>3}"
         home_line += f" {home_score:>5}"
         score_display += f"{home_line}\n"
@@ -118,91 +407,112 @@ def format_score_breakdown(game: Dict, league: str) -> str:
     score_display += "```"
     return score_display
 
-def format_situation(situation: Dict, league: str, game: Dict = None) -> str:
-    if not situation:
+def format_situation(situation: Dict, league: str, game: Optional[Game] = None) -> str:
+    league_info = LEAGUES.get(league)
+    if league_info is None:
+        return ""
+    return league_info.format_situation(situation, game)
+
+def detailed_render_state(game: Game, league: str) -> Tuple:
+    # Matches DETAILED_FIELDS: everything create_detailed_embed reads from the scoreboard
+    situation = "" if game.completed else format_situation(game.situation, league, game)
+    away_lines = tuple(score.get('value') for score in game.away_linescores)
+    home_lines = tuple(score.get('value') for score in game.home_linescores)
+    return game.render_state() + (situation, away_lines, home_lines)
+
+def format_team_stats(summary: Dict, game: Game, limit: int = 10) -> str:
+    teams = {team.get('team', {}).get('id'): team.get('statistics', []) for team in summary.get('boxscore', {}).get('teams', [])}
+    away_stats = teams.get(game.away_team_id)
+    home_stats = teams.get(game.home_team_id)
+    if not away_stats or not home_stats:
         return ""
     
-    if league == 'nfl':
-        parts = []
-        if situation.get('possession'):
-            possession_id = str(situation['possession'])
-            possession_team = "Unknown"
-            
-            if game:
-                if possession_id == str(game.get('home_team_id')):
-                    possession_team = game.get('home_team_abbr', game.get('home_team', 'Unknown'))
-                elif possession_id == str(game.get('away_team_id')):
-                    possession_team = game.get('away_team_abbr', game.get('away_team', 'Unknown'))
-                else:
-                    possession_team = game.get('home_team_abbr', 'Unknown')
-            
-            parts.append(f"🏈 **{possession_team}** has possession")
-        
-        if situation.get('downDistanceText'):
-            parts.append(f"📏 {situation['downDistanceText']}")
-        
-        if situation.get('possessionText'):
-            parts.append(f"📍 {situation['possessionText']}")
-        
-        return "\n".join(parts) if parts else ""
-    elif league == 'mlb':
-        parts = []
-        if situation.get('batter'):
-            batter_name = situation['batter'].get('athlete', {}).get('displayName', 'Unknown')
-            parts.append(f"⚾ **At Bat:** {batter_name}")
-        
-        if situation.get('balls') is not None and situation.get('strikes') is not None:
-            balls = situation.get('balls', 0)
-            strikes = situation.get('strikes', 0)
-            outs = situation.get('outs', 0)
-            parts.append(f"**Count:** {balls}-{strikes}, {outs} out(s)")
-        
-        if situation.get('onFirst') or situation.get('onSecond') or situation.get('onThird'):
-            bases = []
-            if situation.get('onFirst'):
-                bases.append('1st')
-            if situation.get('onSecond'):
-                bases.append('2nd')
-            if situation.get('onThird'):
-                bases.append('3rd')
-            if bases:
-                parts.append(f"🔶 Runners on: {', '.join(bases)}")
-        
-        return "\n".join(parts) if parts else ""
-    
-    return ""
+    home_values = {stat.get('name'): stat.get('displayValue', '-') for stat in home_stats}
+    away_abbr = game.away_team_abbr or game.away_team[:3].upper()
+    home_abbr = game.home_team_abbr or game.home_team[:3].upper()
+    lines = [f"{'':<16} {away_abbr:>7} {home_abbr:>7}"]
+    for stat in away_stats[:limit]:
+        label = (stat.get('label') or stat.get('name', ''))[:16]
+        lines.append(f"{label:<16} {stat.get('displayValue', '-'):>7} {home_values.get(stat.get('name'), '-'):>7}")
+    return "```\n" + "\n".join(lines) + "\n```"
+
+def format_leaders(summary: Dict, game: Game, per_team: int = 3) -> str:
+    abbrs = {game.away_team_id: game.away_team_abbr, game.home_team_id: game.home_team_abbr}
+    lines = []
+    for team in summary.get('leaders', []):
+        abbr = abbrs.get(team.get('team', {}).get('id'))
+        if abbr is None:
+            continue
+        for category in team.get('leaders', [])[:per_team]:
+            top = (category.get('leaders') or [{}])[0]
+            athlete = top.get('athlete', {}).get('displayName', '')
+            if athlete:
+                lines.append(f"**{abbr}** {category.get('displayName', '')}: {athlete} · {top.get('displayValue', '')}")
+    return "\n".join(lines)[:1024]
+
+def create_detailed_embed(game: Game, league: str, bot_user=None, summary: Optional[Dict] = None) -> discord.Embed:
+    embed = create_game_embed(game, league, bot_user)
+    embed.add_field(name="Box Score", value=format_score_breakdown(game, league), inline=False)
+    
+    if not game.completed:
+        situation = format_situation(game.situation, league, game)
+        if situation:
+            embed.add_field(name="Situation", value=situation, inline=False)
+    
+    # The summary is optional: without it (not fetched yet, or ESPN failing) the scoreboard detail still shows
+    if summary:
+        stats = format_team_stats(summary, game)
+        if stats:
+            embed.add_field(name="Team Stats", value=stats, inline=False)
+        leaders = format_leaders(summary, game)
+        if leaders:
+            embed.add_field(name="Leaders", value=leaders, inline=False)
+    
+    return embed
 
 def get_period_name(league: str, period: int) -> str:
-    if league == 'nfl':
-        if period <= 4:
-            return f"Q{period}"
-        else:
-            return f"OT{period - 4}"
-    elif league == 'nba':
-        if period <= 4:
-            return f"Q{period}"
-        else:
-            return f"OT{period - 4}"
-    elif league == 'nhl':
-        if period <= 3:
-            return f"Period {period}"
-        else:
-            return "OT"
-    elif league == 'mlb':
-        return f"Inning {period}"
-    return f"Period {period}"
+    league_info = LEAGUES.get(league)
+    if league_info is None:
+        return f"Period {period}"
+    return league_info.period_name(period)
 
 class ScoreCommands(commands.Cog):
-    def __init__(self, bot, sports_api, game_tracker):
+    def __init__(self, bot, sports_api, game_tracker, follow_scheduler: Optional[FollowScheduler] = None):
         self.bot = bot
         self.sports_api = sports_api
         self.game_tracker = game_tracker
+        self.follow_scheduler = follow_scheduler if follow_scheduler is not None else FollowScheduler()
+    
+    async def cog_before_invoke(self, ctx):
+        ctx.metrics_started = time.perf_counter()
+    
+    async def cog_after_invoke(self, ctx):
+        # Runs even when the command raised, so failures are timed too
+        name = ctx.command.qualified_name
+        COMMAND_SECONDS.labels(name).observe(time.perf_counter() - ctx.metrics_started)
+        COMMANDS.labels(name, 'error' if ctx.command_failed else 'ok').inc()
+    
+    def _notice(self, description: str, color: int) -> discord.Embed:
+        embed = discord.Embed(description=description, color=color)
+        embed.set_author(
+            name="Blazed A.I Sports Tracker",
+            icon_url=self.bot.user.display_avatar.url
+        )
+        embed.set_footer(
+            text="Blazed A.I",
+            icon_url=self.bot.user.display_avatar.url
+        )
+        return embed
     
     @commands.command(name='scores')
-    async def scores(self, ctx, league: str = None):
-        if league and league.lower() not in ['nfl', 'mlb', 'nba', 'nhl']:
+    async def scores(self, ctx, league: str = None, when: str = None):
+        if when and league and league.lower() in SUPPORTED_LEAGUES:
+            await self.scores_on(ctx, league.lower(), when)
+            return
+        
+        if league and league.lower() not in SUPPORTED_LEAGUES:
             error_embed = discord.Embed(
-                description="⚠️ Please specify a valid league: NFL, MLB, NBA, or NHL",
+                description=f"⚠️ Please specify a valid league: {LEAGUE_LIST_TEXT}",
                 color=0xFF0000
             )
             error_embed.set_author(
@@ -216,7 +526,7 @@ class ScoreCommands(commands.Cog):
             await ctx.send(embed=error_embed)
             return
         
-        leagues_to_check = [league.lower()] if league else ['nfl', 'mlb', 'nba', 'nhl']
+        leagues_to_check = [league.lower()] if league else list(SUPPORTED_LEAGUES)
         
         fetch_embed = discord.Embed(
             description="🔍 Fetching scores...",
@@ -232,8 +542,7 @@ class ScoreCommands(commands.Cog):
         )
         await ctx.send(embed=fetch_embed)
         
-        for lg in leagues_to_check:
-            data = await self.sports_api.fetch_scores(lg)
+        async for lg, data in self.sports_api.fetch_many(leagues_to_check):
             if not data:
                 error_embed = discord.Embed(
                     description=f"⚠️ Could not fetch {lg.upper()} scores at this time.",
@@ -267,15 +576,47 @@ class ScoreCommands(commands.Cog):
                 await ctx.send(embed=info_embed)
                 continue
             
-            for game in games:
-                embed = create_game_embed(game, lg, self.bot.user)
-                await ctx.send(embed=embed)
+            embeds = [render_game_embed(game, lg, self.bot.user) for game in games]
+            for batch in pack_embeds(embeds):
+                await ctx.send(embeds=batch)
+    
+    async def scores_on(self, ctx, league: str, when: str):
+        today = espn_today()
+        days = parse_dates(when, today)
+        if days is None:
+            await ctx.send(embed=self._notice(
+                "⚠️ Please specify a date like `yesterday`, `2026-10-12` or a range like `2026-10-10..2026-10-12`.",
+                0xFF0000
+            ))
+            return
+        if len(days) > HISTORY_MAX_DAYS:
+            await ctx.send(embed=self._notice(f"⚠️ Date ranges can span at most {HISTORY_MAX_DAYS} days.", 0xFF0000))
+            return
+        
+        # Finished days come straight from the archive, so only uncached days cost a request
+        embeds = []
+        failed = []
+        for day, data in await self.sports_api.fetch_dates(league, days):
+            if data is None:
+                failed.append(day)
+                continue
+            games = self.sports_api.parse_games(data, league, memoize=day == today)
+            if games:
+                embeds.append(create_day_embed(games, league, day, self.bot.user))
+        
+        if failed:
+            missing = ", ".join(day.strftime('%b %d') for day in failed)
+            await ctx.send(embed=self._notice(f"⚠️ Could not fetch {league.upper()} scores for {missing}.", 0xFF0000))
+        if not embeds and len(failed) < len(days):
+            await ctx.send(embed=self._notice(f"📅 No {league.upper()} games on {when}.", 0xFFA500))
+        for batch in pack_embeds(embeds):
+            await ctx.send(embeds=batch)
     
     @commands.command(name='track')
     async def track(self, ctx, league: str = None):
-        if league and league.lower() not in ['nfl', 'mlb', 'nba', 'nhl']:
+        if league and league.lower() not in SUPPORTED_LEAGUES:
             error_embed = discord.Embed(
-                description="⚠️ Please specify a valid league: NFL, MLB, NBA, or NHL",
+                description=f"⚠️ Please specify a valid league: {LEAGUE_LIST_TEXT}",
                 color=0xFF0000
             )
             error_embed.set_author(
@@ -289,7 +630,7 @@ class ScoreCommands(commands.Cog):
             await ctx.send(embed=error_embed)
             return
         
-        leagues_to_track = [league.lower()] if league else ['nfl', 'mlb', 'nba', 'nhl']
+        leagues_to_track = [league.lower()] if league else list(SUPPORTED_LEAGUES)
         
         setup_embed = discord.Embed(
             description="🔴 Setting up live score tracking...",
@@ -305,13 +646,12 @@ class ScoreCommands(commands.Cog):
         )
         await ctx.send(embed=setup_embed)
         
-        for lg in leagues_to_track:
-            data = await self.sports_api.fetch_scores(lg)
+        async for lg, data in self.sports_api.fetch_many(leagues_to_track):
             if not data:
                 continue
             
             games = self.sports_api.parse_games(data, lg)
-            active_games = [g for g in games if not g['completed']]
+            active_games = [g for g in games if not g.completed]
             
             if not active_games:
                 info_embed = discord.Embed(
@@ -329,16 +669,21 @@ class ScoreCommands(commands.Cog):
                 await ctx.send(embed=info_embed)
                 continue
             
-            for game in active_games:
-                embed = create_game_embed(game, lg, self.bot.user)
-                message = await ctx.send(embed=embed)
-                self.game_tracker.add_tracked_message(game['id'], message, lg)
-                score_key = f"{game['away_score']}-{game['home_score']}"
-                self.game_tracker.update_last_score(game['id'], score_key)
-        
-        tracked_count = len(self.game_tracker.get_tracked_games())
+            new_games = [g for g in active_games if not self.game_tracker.is_tracked_in(g.id, ctx.channel.id)]
+            embeds = [render_game_embed(game, lg, self.bot.user) for game in new_games]
+            pending = iter(zip(new_games, embeds))
+            
+            # Each message carries several games; the tracker remembers which slot each game occupies
+            for batch in pack_embeds(embeds):
+                message = await ctx.send(embeds=batch)
+                for slot in range(len(batch)):
+                    game, embed = next(pending)
+                    subscription = self.game_tracker.add_tracked_message(game.id, message, lg, slot=slot, embed=embed)
+                    self.game_tracker.update_game_state(subscription, game)
+        
+        tracked_count = self.game_tracker.channel_count(ctx.channel.id)
         success_embed = discord.Embed(
-            description=f"✅ Now tracking **{tracked_count}** active game(s)! Embeds will auto-update every 30 seconds.",
+            description=f"✅ Now tracking **{tracked_count}** active game(s)! Embeds will auto-update as the games progress.",
             color=0x00FF00
         )
         success_embed.set_author(
@@ -352,11 +697,15 @@ class ScoreCommands(commands.Cog):
         await ctx.send(embed=success_embed)
     
     @commands.command(name='stoptrack')
-    async def stoptrack(self, ctx):
-        count = len(self.game_tracker.get_tracked_games())
-        self.game_tracker.tracked_messages.clear()
+    async def stoptrack(self, ctx, scope: str = None):
+        if scope and scope.lower() == 'channel' or ctx.guild is None:
+            count = self.game_tracker.stop_channel(ctx.channel.id)
+            where = "this channel"
+        else:
+            count = self.game_tracker.stop_guild(ctx.guild.id)
+            where = "this server"
         stop_embed = discord.Embed(
-            description=f"⏹️ Stopped tracking **{count}** game(s). Use `!track` to start tracking again.",
+            description=f"⏹️ Stopped tracking **{count}** game(s) in {where}. Use `!track` to start tracking again.",
             color=0xFF0000
         )
         stop_embed.set_author(
@@ -371,9 +720,9 @@ class ScoreCommands(commands.Cog):
     
     @commands.command(name='games')
     async def games(self, ctx, league: str = None):
-        if league and league.lower() not in ['nfl', 'mlb', 'nba', 'nhl']:
+        if league and league.lower() not in SUPPORTED_LEAGUES:
             error_embed = discord.Embed(
-                description="⚠️ Please specify a valid league: NFL, MLB, NBA, or NHL",
+                description=f"⚠️ Please specify a valid league: {LEAGUE_LIST_TEXT}",
                 color=0xFF0000
             )
             error_embed.set_author(
@@ -387,7 +736,7 @@ class ScoreCommands(commands.Cog):
             await ctx.send(embed=error_embed)
             return
         
-        leagues_to_check = [league.lower()] if league else ['nfl', 'mlb', 'nba', 'nhl']
+        leagues_to_check = [league.lower()] if league else list(SUPPORTED_LEAGUES)
         
         fetch_embed = discord.Embed(
             description="🔍 Fetching available games...",
@@ -403,8 +752,7 @@ class ScoreCommands(commands.Cog):
         )
         await ctx.send(embed=fetch_embed)
         
-        for lg in leagues_to_check:
-            data = await self.sports_api.fetch_scores(lg)
+        async for lg, data in self.sports_api.fetch_many(leagues_to_check):
             if not data:
                 continue
             
@@ -413,8 +761,8 @@ class ScoreCommands(commands.Cog):
                 continue
             
             embed = discord.Embed(
-                title=f"{LEAGUE_NAMES.get(lg, lg.upper())} Games",
-                color=LEAGUE_COLORS.get(lg, 0x000000)
+                title=f"{LEAGUES[lg].name} Games",
+                color=LEAGUES[lg].color
             )
             
             embed.set_author(
@@ -424,125 +772,175 @@ class ScoreCommands(commands.Cog):
             
             game_list = []
             for i, game in enumerate(games, 1):
-                status = "🔴 Live" if not game['completed'] and game['period'] > 0 else ("✅ Final" if game['completed'] else "⏰ Scheduled")
-                game_list.append(f"`{i}.` {game['away_team_abbr']} @ {game['home_team_abbr']} - {status}")
+                status = "🔴 Live" if not game.completed and game.period > 0 else ("✅ Final" if game.completed else "⏰ Scheduled")
+                game_list.append(f"`{i}.` {game.away_team_abbr} @ {game.home_team_abbr} - {status}")
             
             if game_list:
                 embed.add_field(name="Available Games", value="\n".join(game_list), inline=False)
-                embed.add_field(name="How to Track", value=f"Use `!trackgame {lg} <number>` to track a specific game\nExample: `!trackgame {lg} 1`", inline=False)
+                embed.add_field(name="How to Track", value=f"Use `!trackgame {lg} <team or number>` to track a specific game\nExample: `!trackgame {lg} 1`", inline=False)
                 embed.set_footer(
-                    text=f"Blazed A.I • {LEAGUE_NAMES.get(lg, lg.upper())}",
+                    text=f"Blazed A.I • {LEAGUES[lg].name}",
                     icon_url=self.bot.user.display_avatar.url
                 )
                 await ctx.send(embed=embed)
     
-    @commands.command(name='trackgame')
-    async def trackgame(self, ctx, league: str = None, game_number: int = None):
-        if not league or not game_number:
-            usage_embed = discord.Embed(
-                title="Track Game Usage",
-                description="Usage: `!trackgame <league> <game_number>`\nExample: `!trackgame nfl 1`\nUse `!games` to see available games.",
-                color=0xFFA500
-            )
-            usage_embed.set_author(
-                name="Blazed A.I Sports Tracker",
-                icon_url=self.bot.user.display_avatar.url
-            )
-            usage_embed.set_footer(
-                text="Blazed A.I",
-                icon_url=self.bot.user.display_avatar.url
-            )
-            await ctx.send(embed=usage_embed)
+    @commands.hybrid_command(name='trackgame')
+    async def trackgame(self, ctx, league: str = None, *, team: str = None):
+        if ctx.interaction:
+            # A cold scoreboard or a detailed summary can take longer than Discord's 3s interaction window
+            await ctx.defer()
+        
+        # "!trackgame nfl chiefs detailed" tracks with the box score and summary stats
+        words = (team or '').split()
+        detailed = len(words) > 1 and words[-1].lower() == 'detailed'
+        if detailed:
+            team = ' '.join(words[:-1])
+        
+        lg = (league or '').lower()
+        usage = "Usage: `!trackgame <league> <team or game_number> [detailed]`\nExample: `!trackgame nfl chiefs` or `!trackgame nfl 1`\nUse `!games` to see available games."
+        game = await self._resolve_game(ctx, lg, team, usage)
+        if game is None:
             return
         
-        if league.lower() not in ['nfl', 'mlb', 'nba', 'nhl']:
-            error_embed = discord.Embed(
-                description="⚠️ Please specify a valid league: NFL, MLB, NBA, or NHL",
-                color=0xFF0000
-            )
-            error_embed.set_author(
-                name="Blazed A.I Sports Tracker",
-                icon_url=self.bot.user.display_avatar.url
-            )
-            error_embed.set_footer(
-                text="Blazed A.I",
-                icon_url=self.bot.user.display_avatar.url
-            )
-            await ctx.send(embed=error_embed)
+        if game.completed:
+            await ctx.send(embed=self._notice("⚠️ This game has already completed. Only active games can be tracked.", 0xFF0000))
             return
-        
-        lg = league.lower()
-        data = await self.sports_api.fetch_scores(lg)
-        if not data:
-            error_embed = discord.Embed(
-                description=f"⚠️ Could not fetch {lg.upper()} games at this time.",
-                color=0xFF0000
-            )
-            error_embed.set_author(
-                name="Blazed A.I Sports Tracker",
-                icon_url=self.bot.user.display_avatar.url
-            )
-            error_embed.set_footer(
-                text="Blazed A.I",
-                icon_url=self.bot.user.display_avatar.url
-            )
-            await ctx.send(embed=error_embed)
+        if self.game_tracker.is_tracked_in(game.id, ctx.channel.id):
+            await ctx.send(embed=self._notice(f"📌 {game.away_team_abbr} @ {game.home_team_abbr} is already being tracked in this channel.", 0xFFA500))
             return
         
-        games = self.sports_api.parse_games(data, lg)
-        if not games or game_number < 1 or game_number > len(games):
-            error_embed = discord.Embed(
-                description=f"❌ Invalid game number. Use `!games {lg}` to see available games.",
-                color=0xFF0000
-            )
-            error_embed.set_author(
-                name="Blazed A.I Sports Tracker",
-                icon_url=self.bot.user.display_avatar.url
-            )
-            error_embed.set_footer(
-                text="Blazed A.I",
-                icon_url=self.bot.user.display_avatar.url
-            )
-            await ctx.send(embed=error_embed)
-            return
+        if detailed:
+            summary = await self.sports_api.fetch_summary(lg, game.id, fingerprint(detailed_render_state(game, lg)), game.completed)
+            embed = create_detailed_embed(game, lg, self.bot.user, summary)
+        else:
+            embed = render_game_embed(game, lg, self.bot.user)
+        # Interaction replies can only be edited for 15 minutes, so slash invocations post the tracked embed to the channel
+        message = await (ctx.channel.send if ctx.interaction else ctx.send)(embed=embed)
+        subscription = self.game_tracker.add_tracked_message(game.id, message, lg, embed=embed, detailed=detailed)
+        self.game_tracker.update_game_state(subscription, game)
         
-        game = games[game_number - 1]
+        await ctx.send(embed=self._notice(f"✅ Now tracking {game.away_team_abbr} @ {game.home_team_abbr}! Embed will auto-update as the game progresses.", 0x00FF00))
+    
+    @trackgame.autocomplete('league')
+    async def trackgame_league_autocomplete(self, interaction: discord.Interaction, current: str) -> List[app_commands.Choice[str]]:
+        return [
+            app_commands.Choice(name=LEAGUES[league].name, value=league)
+            for league in SUPPORTED_LEAGUES if league.startswith(current.lower())
+        ]
+    
+    @trackgame.autocomplete('team')
+    async def trackgame_team_autocomplete(self, interaction: discord.Interaction, current: str) -> List[app_commands.Choice[str]]:
+        league = (interaction.namespace.league or '').lower()
+        # Never fetches: suggestions come from whatever scoreboard the bot already holds
+        index = self.sports_api.cached_team_index(league) if league in SUPPORTED_LEAGUES else None
+        if index is None:
+            return []
+        return [
+            app_commands.Choice(name=f"{game.away_team} @ {game.home_team} · {game.detail}"[:100], value=game.id)
+            for game in index.suggest(current)
+        ]
+    
+    async def _resolve_team(self, ctx, league: str, team: str, usage: str) -> Optional[Dict]:
+        if not league or not team:
+            await ctx.send(embed=self._notice(usage, 0xFFA500))
+            return None
+        if league not in SUPPORTED_LEAGUES:
+            await ctx.send(embed=self._notice(f"⚠️ Please specify a valid league: {LEAGUE_LIST_TEXT}", 0xFF0000))
+            return None
+        
+        directory = await self.sports_api.team_directory(league)
+        if directory is None:
+            await ctx.send(embed=self._notice(f"⚠️ Could not fetch {league.upper()} teams at this time.", 0xFF0000))
+            return None
+        
+        matches = directory.search(team)
+        if not matches:
+            await ctx.send(embed=self._notice(f"❌ No {league.upper()} team matches `{team}`.", 0xFF0000))
+            return None
+        if len(matches) > 1:
+            options = "\n".join(f"• {match.get('displayName', match['id'])}" for match in matches[:10])
+            await ctx.send(embed=self._notice(f"🔎 `{team}` matches several {league.upper()} teams. Please be more specific:\n{options}", 0xFFA500))
+            return None
+        return matches[0]
+    
+    async def _resolve_game(self, ctx, league: str, team: Optional[str], usage: str) -> Optional[Game]:
+        if not league or not team:
+            await ctx.send(embed=self._notice(usage, 0xFFA500))
+            return None
+        if league not in SUPPORTED_LEAGUES:
+            await ctx.send(embed=self._notice(f"⚠️ Please specify a valid league: {LEAGUE_LIST_TEXT}", 0xFF0000))
+            return None
+        
+        # Resolved against a scoreboard at most cache_ttl old; a fresh cached one costs no request
+        index = await self.sports_api.team_index(league)
+        if index is None:
+            await ctx.send(embed=self._notice(f"⚠️ Could not fetch {league.upper()} games at this time.", 0xFF0000))
+            return None
+        
+        matches = index.resolve(team)
+        if not matches:
+            await ctx.send(embed=self._notice(f"❌ No {league.upper()} game matches `{team}`. Use `!games {league}` to see available games.", 0xFF0000))
+            return None
+        if len(matches) > 1:
+            options = "\n".join(f"• {match.away_team} @ {match.home_team}" for match in matches[:10])
+            await ctx.send(embed=self._notice(f"🔎 `{team}` matches several {league.upper()} games. Please be more specific:\n{options}", 0xFFA500))
+            return None
+        return matches[0]
+    
+    @commands.command(name='boxscore')
+    async def boxscore(self, ctx, league: str = None, *, team: str = None):
+        lg = (league or '').lower()
+        game = await self._resolve_game(ctx, lg, team, "Usage: `!boxscore <league> <team>`\nExample: `!boxscore nba lakers`")
+        if game is None:
+            return
+        # The index only picks the game; what is drawn comes from a scoreboard no older than cache_ttl
+        data = await self.sports_api.fetch_scores(lg)
+        if data:
+            game = next((g for g in self.sports_api.parse_games(data, lg) if g.id == game.id), game)
         
-        if game['completed']:
-            error_embed = discord.Embed(
-                description="⚠️ This game has already completed. Only active games can be tracked.",
-                color=0xFF0000
-            )
-            error_embed.set_author(
-                name="Blazed A.I Sports Tracker",
-                icon_url=self.bot.user.display_avatar.url
-            )
-            error_embed.set_footer(
-                text="Blazed A.I",
-                icon_url=self.bot.user.display_avatar.url
-            )
-            await ctx.send(embed=error_embed)
+        # Every viewer of the same game state shares one cached summary download
+        summary = await self.sports_api.fetch_summary(lg, game.id, fingerprint(detailed_render_state(game, lg)), game.completed)
+        await ctx.send(embed=create_detailed_embed(game, lg, self.bot.user, summary))
+    
+    @commands.command(name='follow')
+    async def follow(self, ctx, league: str = None, *, team: str = None):
+        lg = (league or '').lower()
+        usage = "Usage: `!follow <league> <team>`\nExample: `!follow nfl chiefs`\nThe team's games are tracked here automatically once they start."
+        match = await self._resolve_team(ctx, lg, team, usage)
+        if match is None:
             return
         
-        embed = create_game_embed(game, lg, self.bot.user)
-        message = await ctx.send(embed=embed)
-        self.game_tracker.add_tracked_message(game['id'], message, lg)
-        score_key = f"{game['away_score']}-{game['home_score']}"
-        self.game_tracker.update_last_score(game['id'], score_key)
+        name = match.get('displayName', team)
+        follow = Follow(lg, match['id'], ctx.channel.id, ctx.guild.id if ctx.guild else None, name)
+        if not self.follow_scheduler.add(follow):
+            await ctx.send(embed=self._notice(f"📌 This channel already follows **{name}**.", 0xFFA500))
+            return
+        await ctx.send(embed=self._notice(
+            f"✅ Now following **{name}**! Their games will be tracked here automatically once they start.",
+            0x00FF00
+        ))
+    
+    @commands.command(name='unfollow')
+    async def unfollow(self, ctx, league: str = None, *, team: str = None):
+        lg = (league or '').lower()
+        match = await self._resolve_team(ctx, lg, team, "Usage: `!unfollow <league> <team>`\nExample: `!unfollow nfl chiefs`")
+        if match is None:
+            return
         
-        success_embed = discord.Embed(
-            description=f"✅ Now tracking {game['away_team_abbr']} @ {game['home_team_abbr']}! Embed will auto-update every 30 seconds.",
-            color=0x00FF00
-        )
-        success_embed.set_author(
-            name="Blazed A.I Sports Tracker",
-            icon_url=self.bot.user.display_avatar.url
-        )
-        success_embed.set_footer(
-            text="Blazed A.I",
-            icon_url=self.bot.user.display_avatar.url
-        )
-        await ctx.send(embed=success_embed)
+        name = match.get('displayName', team)
+        if self.follow_scheduler.remove(lg, match['id'], ctx.channel.id) is None:
+            await ctx.send(embed=self._notice(f"📌 This channel does not follow **{name}**.", 0xFFA500))
+            return
+        await ctx.send(embed=self._notice(f"⏹️ Stopped following **{name}** in this channel.", 0xFF0000))
+    
+    @commands.command(name='follows')
+    async def follows(self, ctx):
+        follows = self.follow_scheduler.in_channel(ctx.channel.id)
+        if not follows:
+            await ctx.send(embed=self._notice("📅 This channel does not follow any teams. Use `!follow <league> <team>` to add one.", 0xFFA500))
+            return
+        lines = "\n".join(f"• {follow.team_name} ({follow.league.upper()})" for follow in follows)
+        await ctx.send(embed=self._notice(f"🔔 Teams followed in this channel:\n{lines}", 0xFF6B00))
     
     @commands.command(name='help_sports')
     async def help_sports(self, ctx):
@@ -563,6 +961,12 @@ class ScoreCommands(commands.Cog):
             inline=False
         )
         
+        embed.add_field(
+            name="📅 !scores <league> <date|range>",
+            value=f"Final scores from past days (up to {HISTORY_MAX_DAYS} at once)\n`!scores nba yesterday` or `!scores nfl 2026-10-10..2026-10-12`",
+            inline=False
+        )
+        
         embed.add_field(
             name="🎯 !games [league]",
             value="List available games with numbers\n`!games nfl` to see game options",
@@ -576,20 +980,32 @@ class ScoreCommands(commands.Cog):
         )
         
         embed.add_field(
-            name="🎮 !trackgame <league> <number>",
-            value="Track a specific game\n`!trackgame nfl 1` to track game #1",
+            name="🎮 !trackgame <league> <team|number>",
+            value="Track a specific game by team name or `!games` number\n`!trackgame nfl chiefs` or `!trackgame nfl 1`, also available as `/trackgame`",
+            inline=False
+        )
+        
+        embed.add_field(
+            name="📋 !boxscore <league> <team>",
+            value="Box score, situation, team stats and leaders for one game\n`!boxscore nfl chiefs`; add `detailed` to `!trackgame` to track with this view",
+            inline=False
+        )
+        
+        embed.add_field(
+            name="🔔 !follow <league> <team>",
+            value="Auto-track a team's games in this channel when they start\n`!follow nfl chiefs`, `!unfollow nfl chiefs`, `!follows` to list",
             inline=False
         )
         
         embed.add_field(
-            name="⏹️ !stoptrack",
-            value="Stop tracking all games",
+            name="⏹️ !stoptrack [channel]",
+            value="Stop tracking games in this server\n`!stoptrack channel` to only stop this channel",
             inline=False
         )
         
         embed.add_field(
             name="🏈 Supported Leagues",
-            value="NFL • MLB • NBA • NHL",
+            value=LEAGUE_BULLETS_TEXT,
             inline=False
         )
         
@@ -600,5 +1016,5 @@ class ScoreCommands(commands.Cog):
         
         await ctx.send(embed=embed)
 
-async def setup(bot, sports_api, game_tracker):
-    await bot.add_cog(ScoreCommands(bot, sports_api, game_tracker))
+async def setup(bot, sports_api, game_tracker, follow_scheduler=None):
+    await bot.add_cog(ScoreCommands(bot, sports_api, game_tracker, follow_scheduler))
@@ -5,25 +5,83 @@ load_dotenv()
 
 DISCORD_TOKEN = os.getenv('DISCORD_BOT_TOKEN')
 
-ESPN_API_URLS = {
-    'nfl': 'https://site.api.espn.com/apis/site/v2/sports/football/nfl/scoreboard',
-    'mlb': 'https://site.api.espn.com/apis/site/v2/sports/baseball/mlb/scoreboard',
-    'nba': 'https://site.api.espn.com/apis/site/v2/sports/basketball/nba/scoreboard',
-    'nhl': 'https://site.api.espn.com/apis/site/v2/sports/hockey/nhl/scoreboard'
-}
+ESPN_API_BASE = 'https://site.api.espn.com/apis/site/v2/sports'
+# ESPN groups games into scoreboard days by US Eastern time
+ESPN_TIMEZONE = 'America/New_York'
 
 UPDATE_INTERVAL = 30
 
-LEAGUE_COLORS = {
-    'nfl': 0x013369,
-    'mlb': 0x041E42,
-    'nba': 0x1D428A,
-    'nhl': 0x000000
-}
-
-LEAGUE_NAMES = {
-    'nfl': 'NFL',
-    'mlb': 'MLB',
-    'nba': 'NBA',
-    'nhl': 'NHL'
-}
+POLL_TICK = 5
+# Work budget per update tick; kept under POLL_TICK so ticks never overlap or drift
+TICK_DEADLINE = 4
+POLL_CRUNCH_INTERVAL = 8
+POLL_BREAK_INTERVAL = 60
+POLL_PREGAME_INTERVAL = 60
+POLL_PREGAME_WINDOW = 900
+POLL_IDLE_INTERVAL = 600
+POLL_CRUNCH_CLOCK = 120
+
+SCORES_CACHE_TTL = 15
+SCORES_SELECTIVE_DECODE = True
+FETCH_CONCURRENCY = 4
+# Per-game summaries (box scores): a live game's summary is refetched only after its scoreboard
+# state changes, at most every SUMMARY_LIVE_INTERVAL seconds; others after SUMMARY_IDLE_TTL
+SUMMARY_LIVE_INTERVAL = 30
+SUMMARY_IDLE_TTL = 600
+SUMMARY_CACHE_SIZE = 256
+# Longest an update tick waits for summaries; detailed embeds whose summary is still loading are drawn without it
+SUMMARY_WAIT = 0.5
+# Events buffered per SportsAPI.watch subscriber before the oldest are dropped
+WATCH_QUEUE_SIZE = 256
+
+HTTP_POOL_LIMIT = 20
+HTTP_POOL_LIMIT_PER_HOST = 8
+HTTP_KEEPALIVE_TIMEOUT = 60
+HTTP_DNS_CACHE_TTL = 300
+HTTP_CONNECT_TIMEOUT = 3
+HTTP_READ_TIMEOUT = 8
+HTTP_TOTAL_TIMEOUT = 12
+HTTP_MAX_RETRIES = 2
+HTTP_BACKOFF_BASE = 0.5
+HTTP_BACKOFF_MAX = 4
+
+EDIT_MAX_CONCURRENCY = 10
+EDIT_CHANNEL_INTERVAL = 1.0
+
+MAX_EMBEDS_PER_MESSAGE = 10
+# Discord allows 6000 embed characters per message; leave headroom for tracked embeds growing on edit
+EMBED_BATCH_CHAR_LIMIT = 5000
+EMBED_CACHE_SIZE = 512
+
+TRACKING_DB_PATH = os.getenv('TRACKING_DB_PATH', 'tracking.db')
+# Tracked games missing from their league's scoreboard this long are dropped from tracking
+MISSING_GAME_TTL = 6 * 3600
+
+# Followed teams: schedules are re-read every FOLLOW_REFRESH_INTERVAL seconds, and a game past
+# its listed start that is not under way yet is checked again every FOLLOW_RETRY_INTERVAL seconds
+FOLLOW_REFRESH_INTERVAL = 1800
+FOLLOW_RETRY_INTERVAL = 30
+# Kickoff posts sent at once when a followed team's game goes live
+FOLLOW_START_CONCURRENCY = 10
+
+# Finished past scoreboards are kept here forever; !scores with a date range spans at most HISTORY_MAX_DAYS
+ARCHIVE_DB_PATH = os.getenv('ARCHIVE_DB_PATH', 'scoreboards.db')
+HISTORY_MAX_DAYS = 14
+
+# Sharded mode: SHARD_COUNT > 0 runs an AutoShardedBot for SHARD_IDS (all shards when unset)
+# and reads scoreboards from the shared poller process listening on POLLER_SOCKET
+SHARD_COUNT = int(os.getenv('SHARD_COUNT', '0'))
+SHARD_IDS = [int(shard_id) for shard_id in os.getenv('SHARD_IDS', '').split(',') if shard_id.strip()] or None
+POLLER_SOCKET = os.getenv('POLLER_SOCKET', 'sportyscores.sock')
+POLLER_TIMEOUT = 30
+POLLER_READ_LIMIT = 16 * 1024 * 1024
+
+# RECORD_DIR appends every new scoreboard to compressed files there; REPLAY_PATH serves a
+# recording (file or directory) instead of ESPN, REPLAY_SPEED times faster than it happened
+RECORD_DIR = os.getenv('RECORD_DIR', '')
+REPLAY_PATH = os.getenv('REPLAY_PATH', '')
+REPLAY_SPEED = float(os.getenv('REPLAY_SPEED', '1'))
+
+# Prometheus text endpoint at http://METRICS_HOST:METRICS_PORT/metrics; port 0 disables it
+METRICS_HOST = os.getenv('METRICS_HOST', '127.0.0.1')
+METRICS_PORT = int(os.getenv('METRICS_PORT', '9108'))
@@ -0,0 +1,109 @@
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Tuple
+import discord
+from config import EDIT_MAX_CONCURRENCY, EDIT_CHANNEL_INTERVAL
+from metrics import REGISTRY
+
+EDITS = REGISTRY.counter('sportyscores_discord_edits_total', 'Embed edits by result (sent, failed, rate_limited, coalesced)', ('result',))
+EDIT_SECONDS = REGISTRY.histogram('sportyscores_discord_edit_seconds', 'Discord message edit latency, excluding queueing')
+EDIT_QUEUE_SECONDS = REGISTRY.histogram('sportyscores_discord_edit_queue_seconds', 'Time an edit waits in its channel queue before being sent')
+
+EditCallback = Callable[[discord.Message, Optional[Exception]], None]
+
+def chain_callbacks(first: Optional[EditCallback], second: Optional[EditCallback]) -> Optional[EditCallback]:
+    if first is None or second is None:
+        return first or second
+    
+    def callback(message: discord.Message, error: Optional[Exception]):
+        first(message, error)
+        second(message, error)
+    return callback
+
+class EditScheduler:
+    def __init__(self, max_concurrency: int = EDIT_MAX_CONCURRENCY, channel_interval: float = EDIT_CHANNEL_INTERVAL):
+        self.channel_interval = channel_interval
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        # channel id -> message id -> newest pending edit, oldest message first
+        self._queues: Dict[int, OrderedDict[int, Tuple[discord.Message, List[discord.Embed], Optional[EditCallback], float]]] = {}
+        self._workers: Dict[int, asyncio.Task] = {}
+        self.submitted = 0
+        self.coalesced = 0
+        self.sent = 0
+        self.failed = 0
+        self.max_depth = 0
+    
+    def submit(self, message: discord.Message, embeds: List[discord.Embed], callback: Optional[EditCallback] = None):
+        channel_id = message.channel.id
+        queue = self._queues.setdefault(channel_id, OrderedDict())
+        
+        self.submitted += 1
+        queued_at = time.monotonic()
+        if message.id in queue:
+            # Replacing in place keeps the message's turn in the queue but only the newest embeds are sent
+            self.coalesced += 1
+            EDITS.labels('coalesced').inc()
+            _, _, previous_callback, queued_at = queue[message.id]
+            callback = chain_callbacks(previous_callback, callback)
+        queue[message.id] = (message, embeds, callback, queued_at)
+        self.max_depth = max(self.max_depth, len(queue))
+        
+        if channel_id not in self._workers:
+            self._workers[channel_id] = asyncio.create_task(self._run_channel(channel_id))
+    
+    async def _run_channel(self, channel_id: int):
+        queue = self._queues[channel_id]
+        try:
+            while queue:
+                _, (message, embeds, callback, queued_at) = queue.popitem(last=False)
+                
+                error = None
+                async with self._semaphore:
+                    start = time.monotonic()
+                    EDIT_QUEUE_SECONDS.observe(start - queued_at)
+                    try:
+                        await message.edit(embeds=embeds)
+                        self.sent += 1
+                        EDITS.labels('sent').inc()
+                    except Exception as e:
+                        self.failed += 1
+                        EDITS.labels('rate_limited' if getattr(e, 'status', None) == 429 else 'failed').inc()
+                        error = e
+                    EDIT_SECONDS.observe(time.monotonic() - start)
+                
+                if callback:
+                    try:
+                        callback(message, error)
+                    except Exception as e:
+                        print(f"Error in edit callback for message {message.id}: {e}")
+                
+                # Stay inside the per-channel edit bucket instead of leaning on 429 retries
+                if queue and self.channel_interval:
+                    await asyncio.sleep(self.channel_interval)
+        finally:
+            del self._workers[channel_id]
+            if not queue:
+                del self._queues[channel_id]
+    
+    def queue_depths(self) -> Dict[int, int]:
+        return {channel_id: len(queue) for channel_id, queue in self._queues.items()}
+    
+    @property
+    def pending(self) -> int:
+        return sum(len(queue) for queue in self._queues.values())
+    
+    def stats(self) -> Dict[str, int]:
+        return {
+            'pending': self.pending,
+            'channels': len(self._queues),
+            'submitted': self.submitted,
+            'coalesced': self.coalesced,
+            'sent': self.sent,
+            'failed': self.failed,
+            'max_depth': self.max_depth
+        }
+    
+    async def drain(self):
+        while self._workers:
+            await asyncio.gather(*self._workers.values(), return_exceptions=True)
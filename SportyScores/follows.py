@@ -0,0 +1,139 @@
+import heapq
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Set, Tuple
+from config import FOLLOW_REFRESH_INTERVAL, FOLLOW_RETRY_INTERVAL
+from models import Game
+from tracking_store import TrackingStore
+from metrics import REGISTRY
+
+FOLLOW_STARTS = REGISTRY.counter('sportyscores_follow_starts_total', 'Tracked embeds started automatically for followed teams', ('league',))
+
+@dataclass(slots=True, frozen=True)
+class Follow:
+    league: str
+    team_id: str
+    channel_id: int
+    guild_id: Optional[int]
+    team_name: str
+
+def is_live(game: Game) -> bool:
+    return not game.completed and (game.state == 'in' or game.period > 0)
+
+class FollowScheduler:
+    def __init__(self, store: Optional[TrackingStore] = None):
+        self.store = store
+        # Kickoffs are wall-clock times; replay swaps in the recording's clock
+        self.clock: Callable[[], float] = time.time
+        self.follows: Dict[Tuple[str, str], Dict[int, Follow]] = {}
+        self.by_channel: Dict[int, Set[Tuple[str, str]]] = {}
+        # (wake_at, league, game_id), earliest first; an empty game_id re-reads the league's schedule
+        self._heap: List[Tuple[float, str, str]] = []
+        # Current wake time per (league, game_id); heap entries that no longer match are skipped when popped
+        self._wake_at: Dict[Tuple[str, str], float] = {}
+        # (league, game_id, channel_id) already given an embed, so a stopped game is not re-posted
+        self.started: Set[Tuple[str, str, int]] = set()
+    
+    def __len__(self) -> int:
+        return sum(len(channels) for channels in self.follows.values())
+    
+    def leagues(self) -> Set[str]:
+        return {league for league, _ in self.follows}
+    
+    def add(self, follow: Follow, persist: bool = True) -> bool:
+        key = (follow.league, follow.team_id)
+        channels = self.follows.setdefault(key, {})
+        added = follow.channel_id not in channels
+        channels[follow.channel_id] = follow
+        self.by_channel.setdefault(follow.channel_id, set()).add(key)
+        if persist and self.store:
+            self.store.save_follow(follow.league, follow.team_id, follow.channel_id, follow.guild_id, follow.team_name)
+        # Look at the schedule on the next tick so a game already under way is picked up
+        self._push(self.clock(), follow.league, '')
+        return added
+    
+    def remove(self, league: str, team_id: str, channel_id: int) -> Optional[Follow]:
+        key = (league, team_id)
+        follow = self.follows.get(key, {}).pop(channel_id, None)
+        if follow is None:
+            return None
+        if not self.follows[key]:
+            del self.follows[key]
+        self.by_channel[channel_id].discard(key)
+        if not self.by_channel[channel_id]:
+            del self.by_channel[channel_id]
+        if self.store:
+            self.store.delete_follow(league, team_id, channel_id)
+        return follow
+    
+    def in_channel(self, channel_id: int) -> List[Follow]:
+        return [self.follows[key][channel_id] for key in sorted(self.by_channel.get(channel_id, ()))]
+    
+    def restore(self, owns_guild: Optional[Callable[[Optional[int]], bool]] = None) -> int:
+        if not self.store:
+            return 0
+        restored = 0
+        for row in self.store.load_follows():
+            if owns_guild and not owns_guild(row['guild_id']):
+                continue
+            self.add(Follow(**row), persist=False)
+            restored += 1
+        return restored
+    
+    def _push(self, when: float, league: str, game_id: str):
+        key = (league, game_id)
+        if self._wake_at.get(key) == when:
+            return
+        self._wake_at[key] = when
+        heapq.heappush(self._heap, (when, league, game_id))
+    
+    def due(self) -> Set[str]:
+        # Only the heap's head is looked at, so ticks with nothing due cost the same for any number of follows
+        now = self.clock()
+        leagues = set()
+        while self._heap and self._heap[0][0] <= now:
+            when, league, game_id = heapq.heappop(self._heap)
+            if self._wake_at.get((league, game_id)) != when:
+                continue
+            del self._wake_at[(league, game_id)]
+            leagues.add(league)
+        return leagues
+    
+    def retry(self, league: str, game_id: str = ''):
+        self._push(self.clock() + FOLLOW_RETRY_INTERVAL, league, game_id)
+    
+    def pending_followers(self, game: Game) -> List[Follow]:
+        channels: Dict[int, Follow] = {}
+        for team_id in (game.away_team_id, game.home_team_id):
+            for channel_id, follow in self.follows.get((game.league, team_id), {}).items():
+                if (game.league, game.id, channel_id) not in self.started:
+                    channels.setdefault(channel_id, follow)
+        return list(channels.values())
+    
+    def mark_started(self, game: Game, channel_id: int):
+        self.started.add((game.league, game.id, channel_id))
+    
+    def plan(self, league: str, games: List[Game]) -> List[Game]:
+        # Returns the followed games live right now; the rest are timed to wake at kickoff
+        if league not in self.leagues():
+            return []
+        now = self.clock()
+        current = {game.id for game in games}
+        self.started = {key for key in self.started if key[0] != league or key[1] in current}
+        
+        live = []
+        for game in games:
+            if game.completed or not self.pending_followers(game):
+                self._wake_at.pop((league, game.id), None)
+                continue
+            if is_live(game):
+                live.append(game)
+                continue
+            start = game.start_time
+            kickoff = start.timestamp() if start else now
+            # Past the listed start but not under way yet (weather, overtime in an earlier game): check again soon
+            self._push(kickoff if kickoff > now else now + FOLLOW_RETRY_INTERVAL, league, game.id)
+        
+        # The scoreboard only lists the current day, so look again later for newly listed games
+        self._push(now + FOLLOW_REFRESH_INTERVAL, league, '')
+        return live
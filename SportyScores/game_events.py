@@ -0,0 +1,117 @@
+import asyncio
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Deque, Dict, List, Optional, Set
+from config import POLL_TICK
+from models import Game
+from poll_scheduler import league_poll_interval
+from metrics import REGISTRY
+
+GAME_START = 'start'
+PERIOD_CHANGE = 'period'
+SCORE_CHANGE = 'score'
+SITUATION_CHANGE = 'situation'
+GAME_FINAL = 'final'
+
+GAME_EVENTS = REGISTRY.counter('sportyscores_game_events_total', 'Game events published to watch subscribers', ('league', 'kind'))
+DROPPED_EVENTS = REGISTRY.counter('sportyscores_game_events_dropped_total', 'Events discarded because a subscriber queue was full', ('league',))
+
+@dataclass(slots=True, frozen=True)
+class GameEvent:
+    kind: str
+    game: Game
+    previous: Game = field(repr=False)
+    
+    @property
+    def league(self) -> str:
+        return self.game.league
+
+def diff_game(old: Game, new: Game) -> List[GameEvent]:
+    events = []
+    if new.period != old.period:
+        kind = GAME_START if old.period == 0 or old.state == 'pre' else PERIOD_CHANGE
+        events.append(GameEvent(kind, new, old))
+    if new.home_score != old.home_score or new.away_score != old.away_score:
+        events.append(GameEvent(SCORE_CHANGE, new, old))
+    if not new.completed and new.situation != old.situation:
+        events.append(GameEvent(SITUATION_CHANGE, new, old))
+    if new.completed and not old.completed:
+        events.append(GameEvent(GAME_FINAL, new, old))
+    return events
+
+class EventQueue:
+    def __init__(self, league: str, maxsize: int):
+        self.league = league
+        # A full deque discards its oldest entry on append, so a slow subscriber only ever loses stale events
+        self._events: Deque[GameEvent] = deque(maxlen=maxsize)
+        self._ready = asyncio.Event()
+        self.dropped = 0
+        self.closed = False
+    
+    def __len__(self) -> int:
+        return len(self._events)
+    
+    def put(self, event: GameEvent):
+        if len(self._events) == self._events.maxlen:
+            self.dropped += 1
+            DROPPED_EVENTS.labels(self.league).inc()
+        self._events.append(event)
+        self._ready.set()
+    
+    def close(self):
+        self.closed = True
+        self._ready.set()
+    
+    def __aiter__(self):
+        return self
+    
+    async def __anext__(self) -> GameEvent:
+        while not self._events:
+            if self.closed:
+                raise StopAsyncIteration
+            self._ready.clear()
+            await self._ready.wait()
+        return self._events.popleft()
+
+class LeagueFeed:
+    def __init__(self, league: str):
+        self.league = league
+        self.subscribers: Set[EventQueue] = set()
+        self.games: Dict[str, Game] = {}
+        self.task: Optional[asyncio.Task] = None
+        self._data: Optional[Dict] = None
+    
+    def publish(self, data: Dict, games: List[Game]) -> int:
+        # Cached and 304 scoreboards are the same object, so only new data is diffed
+        if data is self._data:
+            return 0
+        primed = self._data is not None
+        self._data = data
+        
+        published = 0
+        current = {game.id: game for game in games}
+        for game_id, game in current.items():
+            old = self.games.get(game_id)
+            # The first scoreboard only sets the baseline; subscribers get deltas from there on
+            if not primed or old is None:
+                continue
+            for event in diff_game(old, game):
+                GAME_EVENTS.labels(self.league, event.kind).inc()
+                for subscriber in self.subscribers:
+                    subscriber.put(event)
+                published += 1
+        self.games = current
+        return published
+    
+    def poll_interval(self) -> float:
+        # Same adaptive cadence the update loop uses, but never faster than a tick
+        return max(POLL_TICK, league_poll_interval(self.games.values(), datetime.now(timezone.utc)))
+    
+    def close(self):
+        if self.task:
+            self.task.cancel()
+            self.task = None
+        for subscriber in self.subscribers:
+            subscriber.close()
+        self.subscribers.clear()
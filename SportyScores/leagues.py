@@ -0,0 +1,159 @@
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Optional, Tuple
+from models import Game
+
+PRECOMPUTED_PERIODS = 20
+
+def format_football_situation(situation: Dict, game: Optional[Game] = None) -> str:
+    parts = []
+    if situation.get('possession'):
+        possession_id = str(situation['possession'])
+        possession_team = "Unknown"
+        
+        if game:
+            if possession_id == str(game.home_team_id):
+                possession_team = game.home_team_abbr or game.home_team
+            elif possession_id == str(game.away_team_id):
+                possession_team = game.away_team_abbr or game.away_team
+            else:
+                possession_team = game.home_team_abbr or 'Unknown'
+        
+        parts.append(f"🏈 **{possession_team}** has possession")
+    
+    if situation.get('downDistanceText'):
+        parts.append(f"📏 {situation['downDistanceText']}")
+    
+    if situation.get('possessionText'):
+        parts.append(f"📍 {situation['possessionText']}")
+    
+    return "\n".join(parts) if parts else ""
+
+def format_baseball_situation(situation: Dict, game: Optional[Game] = None) -> str:
+    parts = []
+    if situation.get('batter'):
+        batter_name = situation['batter'].get('athlete', {}).get('displayName', 'Unknown')
+        parts.append(f"⚾ **At Bat:** {batter_name}")
+    
+    if situation.get('balls') is not None and situation.get('strikes') is not None:
+        balls = situation.get('balls', 0)
+        strikes = situation.get('strikes', 0)
+        outs = situation.get('outs', 0)
+        parts.append(f"**Count:** {balls}-{strikes}, {outs} out(s)")
+    
+    bases = []
+    if situation.get('onFirst'):
+        bases.append('1st')
+    if situation.get('onSecond'):
+        bases.append('2nd')
+    if situation.get('onThird'):
+        bases.append('3rd')
+    if bases:
+        parts.append(f"🔶 Runners on: {', '.join(bases)}")
+    
+    return "\n".join(parts) if parts else ""
+
+@dataclass(frozen=True, slots=True)
+class League:
+    key: str
+    name: str
+    sport: str
+    color: int
+    # Column headers for the line score table, one per period including overtimes/shootouts
+    period_labels: Tuple[str, ...]
+    regulation_periods: int
+    period_format: str
+    overtime_format: Optional[str]
+    # Poll policy: the period where close games enter crunch time, and what counts as close
+    final_period: int
+    close_margin: int
+    clock_based: bool = True
+    situation_formatter: Optional[Callable[[Dict, Optional[Game]], str]] = None
+    period_names: Tuple[str, ...] = field(default=(), init=False, repr=False)
+    
+    def __post_init__(self):
+        object.__setattr__(self, 'period_names', tuple(
+            self._period_name(period) for period in range(1, PRECOMPUTED_PERIODS + 1)
+        ))
+    
+    def _period_name(self, period: int) -> str:
+        if period <= self.regulation_periods or self.overtime_format is None:
+            return self.period_format.format(period)
+        return self.overtime_format.format(period - self.regulation_periods)
+    
+    def period_name(self, period: int) -> str:
+        if 0 < period <= PRECOMPUTED_PERIODS:
+            return self.period_names[period - 1]
+        return self._period_name(period)
+    
+    def endpoint(self, base_url: str, resource: str = 'scoreboard') -> str:
+        return f"{base_url}/{self.sport}/{self.key}/{resource}"
+    
+    def format_situation(self, situation: Dict, game: Optional[Game] = None) -> str:
+        if not situation or self.situation_formatter is None:
+            return ""
+        return self.situation_formatter(situation, game)
+
+LEAGUES: Dict[str, League] = {league.key: league for league in (
+    League(
+        key='nfl',
+        name='NFL',
+        sport='football',
+        color=0x013369,
+        period_labels=('Q1', 'Q2', 'Q3', 'Q4') + tuple(f'OT{i}' for i in range(1, 6)),
+        regulation_periods=4,
+        period_format='Q{}',
+        overtime_format='OT{}',
+        final_period=4,
+        close_margin=8,
+        situation_formatter=format_football_situation
+    ),
+    League(
+        key='mlb',
+        name='MLB',
+        sport='baseball',
+        color=0x041E42,
+        period_labels=tuple(str(i) for i in range(1, 20)),
+        regulation_periods=9,
+        period_format='Inning {}',
+        overtime_format=None,
+        final_period=8,
+        close_margin=2,
+        clock_based=False,
+        situation_formatter=format_baseball_situation
+    ),
+    League(
+        key='nba',
+        name='NBA',
+        sport='basketball',
+        color=0x1D428A,
+        period_labels=('Q1', 'Q2', 'Q3', 'Q4') + tuple(f'OT{i}' for i in range(1, 6)),
+        regulation_periods=4,
+        period_format='Q{}',
+        overtime_format='OT{}',
+        final_period=4,
+        close_margin=8
+    ),
+    League(
+        key='nhl',
+        name='NHL',
+        sport='hockey',
+        color=0x000000,
+        period_labels=('P1', 'P2', 'P3', 'OT', 'SO'),
+        regulation_periods=3,
+        period_format='Period {}',
+        overtime_format='OT',
+        final_period=3,
+        close_margin=1
+    ),
+)}
+
+def _league_list_text() -> str:
+    names = [league.name for league in LEAGUES.values()]
+    return names[0] if len(names) == 1 else f"{', '.join(names[:-1])}, or {names[-1]}"
+
+SUPPORTED_LEAGUES: Tuple[str, ...] = tuple(LEAGUES)
+LEAGUE_LIST_TEXT = _league_list_text()
+LEAGUE_BULLETS_TEXT = " • ".join(league.name for league in LEAGUES.values())
+
+def get_league(key: str) -> Optional[League]:
+    return LEAGUES.get(key)
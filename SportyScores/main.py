@@ -1,75 +1,386 @@
 import discord
 from discord.ext import commands, tasks
 import asyncio
-from config import DISCORD_TOKEN, UPDATE_INTERVAL
+from typing import Dict, List, Optional, Set, Tuple
+from config import (
+    DISCORD_TOKEN, POLL_TICK, TICK_DEADLINE, METRICS_PORT, SHARD_COUNT, SHARD_IDS,
+    RECORD_DIR, REPLAY_PATH, REPLAY_SPEED, FOLLOW_START_CONCURRENCY, SUMMARY_WAIT
+)
 from sports_api import SportsAPI
-from bot_commands import GameTracker, setup as setup_commands, create_game_embed
+from sharding import RemoteSportsAPI, owns_guild
+from recording import ReplaySportsAPI, SnapshotRecorder
+from models import Game, MessageGroup, Subscription, fingerprint, changed_fields
+from edit_scheduler import EditScheduler
+from poll_scheduler import PollScheduler
+from tracking_store import TrackingStore
+from scoreboard_archive import ScoreboardArchive
+from follows import Follow, FollowScheduler, FOLLOW_STARTS
+from bot_commands import GameTracker, setup as setup_commands, render_game_embed, create_detailed_embed, detailed_render_state
+from metrics import REGISTRY, start_metrics_server, timed
 
 intents = discord.Intents.default()
 intents.message_content = True
 
-bot = commands.Bot(command_prefix='!', intents=intents)
-sports_api = SportsAPI()
-game_tracker = GameTracker()
+if SHARD_COUNT:
+    # Each shard process handles its own guilds; scoreboards come from the shared poller (poller.py)
+    bot = commands.AutoShardedBot(command_prefix='!', intents=intents, shard_count=SHARD_COUNT, shard_ids=SHARD_IDS)
+    sports_api = RemoteSportsAPI()
+else:
+    bot = commands.Bot(command_prefix='!', intents=intents)
+    # Shards ask the poller for past days too, so only the poller and a single process keep an archive
+    sports_api = ReplaySportsAPI(REPLAY_PATH, REPLAY_SPEED) if REPLAY_PATH else SportsAPI(archive=ScoreboardArchive())
+if RECORD_DIR:
+    sports_api.recorder = SnapshotRecorder(RECORD_DIR)
+tracking_store = TrackingStore()
+game_tracker = GameTracker(tracking_store)
+follow_scheduler = FollowScheduler(tracking_store)
+edit_scheduler = EditScheduler()
+poll_scheduler = PollScheduler()
+if isinstance(sports_api, ReplaySportsAPI):
+    poll_scheduler.clock = poll_scheduler.wall_clock = follow_scheduler.clock = sports_api.clock
+# Kickoff posts run beside the update loop so a popular team cannot hold up a tick
+follow_task: Optional[asyncio.Task] = None
+
+TICK_SECONDS = REGISTRY.histogram('sportyscores_update_tick_seconds', 'Duration of each update_scores tick, including ticks with nothing due')
+LEAGUE_POLLS = REGISTRY.counter('sportyscores_league_polls_total', 'League scoreboards polled by the update loop, by result', ('league', 'result'))
+GAMES_UPDATED = REGISTRY.counter('sportyscores_games_updated_total', 'Tracked games re-rendered because their state changed', ('league',))
+GAMES_COMPLETED = REGISTRY.counter('sportyscores_games_completed_total', 'Tracked games that finished and were removed', ('league',))
+TICK_OVERRUNS = REGISTRY.counter('sportyscores_tick_overruns_total', 'Update ticks that hit TICK_DEADLINE before finishing')
+CARRIED_GAMES = REGISTRY.counter('sportyscores_carried_games_total', 'Tracked games deferred to the next tick by the deadline', ('league',))
+COMMAND_ERRORS = REGISTRY.counter('sportyscores_command_errors_total', 'Command errors by exception type', ('error',))
+
+REGISTRY.gauge('sportyscores_tracked_games', 'Distinct games being tracked', function=lambda: len(game_tracker.by_game))
+REGISTRY.gauge('sportyscores_tracked_subscriptions', 'Game subscriptions across all messages', function=lambda: len(game_tracker))
+REGISTRY.gauge('sportyscores_tracked_messages', 'Messages holding tracked game embeds', function=lambda: len(game_tracker.groups))
+REGISTRY.gauge('sportyscores_follows', 'Team follows across all channels', function=lambda: len(follow_scheduler))
+REGISTRY.gauge('sportyscores_edit_queue_depth', 'Embed edits waiting to be sent', function=lambda: edit_scheduler.pending)
+REGISTRY.gauge(
+    'sportyscores_poll_interval_seconds', 'Current adaptive poll interval per league', ('league',),
+    function=lambda: {(league,): interval for league, interval in poll_scheduler.intervals.items()}
+)
 
 @bot.event
 async def on_ready():
     print(f'{bot.user} has connected to Discord!')
     print(f'Bot is in {len(bot.guilds)} guild(s)')
+    if SHARD_COUNT:
+        print(f'Running shard(s) {", ".join(map(str, bot.shard_ids or range(SHARD_COUNT)))} of {SHARD_COUNT}')
+    
+    await setup_commands(bot, sports_api, game_tracker, follow_scheduler)
     
-    await setup_commands(bot, sports_api, game_tracker)
+    # Other shard processes restore the games tracked in their own guilds
+    restored = game_tracker.restore(bot, lambda guild_id: owns_guild(guild_id, SHARD_COUNT, SHARD_IDS))
+    if restored:
+        print(f'Restored {restored} tracked game(s) from {tracking_store.path}')
+    followed = follow_scheduler.restore(lambda guild_id: owns_guild(guild_id, SHARD_COUNT, SHARD_IDS))
+    if followed:
+        print(f'Restored {followed} team follow(s) from {tracking_store.path}')
     
     if not update_scores.is_running():
+        # Registers /trackgame and its team autocomplete; commands are global, so one shard process is enough
+        if not SHARD_COUNT or 0 in (SHARD_IDS or [0]):
+            try:
+                await bot.tree.sync()
+            except discord.HTTPException as e:
+                print(f"Error syncing application commands: {e}")
         update_scores.start()
     
     print('Auto-update task started!')
 
-@tasks.loop(seconds=UPDATE_INTERVAL)
+@tasks.loop(seconds=POLL_TICK)
+@timed(TICK_SECONDS)
 async def update_scores():
-    tracked_games = game_tracker.get_tracked_games()
+    global follow_task
+    await tracking_store.flush()
+    if follow_task is None or follow_task.done():
+        follow_task = asyncio.create_task(start_followed_games())
     
-    if not tracked_games:
+    if not game_tracker:
         return
     
-    games_to_remove = []
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + TICK_DEADLINE
+    games_by_league = game_tracker.games_by_league()
     
-    for game_id, tracked_info in tracked_games.items():
-        league = tracked_info['league']
-        message = tracked_info['message']
-        last_score = tracked_info['last_score']
-        
-        try:
-            data = await sports_api.fetch_scores(league)
+    leagues = poll_scheduler.due(games_by_league)
+    if not leagues:
+        return
+    
+    fetches = {asyncio.create_task(sports_api.fetch_scores(league, max_age=POLL_TICK)): league for league in leagues}
+    carried: Dict[str, List[str]] = {}
+    pending = set(fetches)
+    # Each league is drawn as soon as its own scoreboard arrives, so a slow league only delays itself
+    while pending and time_left(deadline) > 0:
+        done, pending = await asyncio.wait(pending, timeout=time_left(deadline), return_when=asyncio.FIRST_COMPLETED)
+        for task in sorted(done, key=lambda task: leagues.index(fetches[task])):
+            league = fetches[task]
+            late = await poll_league(league, task, games_by_league[league], deadline)
+            if late:
+                carried[league] = late
+    
+    # Requests still running at the deadline keep going inside SportsAPI and are picked up next tick
+    for task in pending:
+        task.cancel()
+        league = fetches[task]
+        carried[league] = list(dict.fromkeys(poll_scheduler.take_carryover(league) + games_by_league[league]))
+    
+    if carried:
+        TICK_OVERRUNS.inc()
+        for league, game_ids in carried.items():
+            poll_scheduler.defer(league, game_ids)
+            CARRIED_GAMES.labels(league).inc(len(game_ids))
+        total = sum(len(game_ids) for game_ids in carried.values())
+        print(f"Update tick hit its {TICK_DEADLINE}s deadline; {total} game(s) in {len(carried)} league(s) carried over to the next tick")
+    
+    stats = edit_scheduler.stats()
+    if stats['pending']:
+        print(f"Edit queue: {stats['pending']} pending across {stats['channels']} channel(s)")
+
+async def poll_league(league: str, task: asyncio.Task, game_ids: List[str], deadline: float) -> List[str]:
+    # Returns the game ids to carry over to the next tick
+    priority = poll_scheduler.take_carryover(league)
+    if time_left(deadline) <= 0:
+        return list(dict.fromkeys(priority + game_ids))
+    
+    data = None if task.exception() else task.result()
+    if not data:
+        LEAGUE_POLLS.labels(league, 'failed').inc()
+        poll_scheduler.retry(league, game_ids, POLL_TICK)
+        # Carried games keep their place at the front of the retry
+        poll_scheduler.defer(league, priority)
+        return []
+    LEAGUE_POLLS.labels(league, 'ok').inc()
+    
+    games = {g.id: g for g in sports_api.parse_games(data, league)}
+    expired = game_tracker.expire_missing(game_ids, games, poll_scheduler.clock())
+    for game_id in expired:
+        removed = game_tracker.remove_tracked_message(game_id)
+        print(f"Game {game_id} missing from the {league.upper()} scoreboard; removed from tracking ({removed} message(s))")
+    if expired:
+        game_ids = [game_id for game_id in game_ids if game_id not in expired]
+    # Games carried over from an overrun tick are drawn before anything else
+    ordered_ids = dict.fromkeys(priority + game_ids)
+    tracked_league_games = [games[game_id] for game_id in ordered_ids if game_id in games and game_id in game_tracker.by_game]
+    poll_scheduler.schedule(league, game_ids, tracked_league_games)
+    
+    try:
+        return await update_league(tracked_league_games, league, deadline)
+    except Exception as e:
+        print(f"Error updating {league.upper()} games: {e}")
+        poll_scheduler.defer(league, priority)
+        return []
+
+async def start_followed_games():
+    leagues = follow_scheduler.due()
+    if not leagues:
+        return
+    
+    semaphore = asyncio.Semaphore(FOLLOW_START_CONCURRENCY)
+    try:
+        async for league, data in sports_api.fetch_many(leagues):
             if not data:
+                # Try again shortly rather than waiting for the next schedule refresh
+                follow_scheduler.retry(league)
                 continue
-            
-            games = sports_api.parse_games(data, league)
-            current_game = next((g for g in games if g['id'] == game_id), None)
-            
-            if not current_game:
+            for game in follow_scheduler.plan(league, sports_api.parse_games(data, league)):
+                embed = render_game_embed(game, league, bot.user)
+                followers = []
+                for follow in follow_scheduler.pending_followers(game):
+                    if game_tracker.is_tracked_in(game.id, follow.channel_id):
+                        follow_scheduler.mark_started(game, follow.channel_id)
+                    else:
+                        followers.append(follow)
+                await asyncio.gather(*(start_followed_game(game, league, follow, embed, semaphore) for follow in followers))
+    except Exception as e:
+        print(f"Error starting followed games: {e}")
+
+async def start_followed_game(game: Game, league: str, follow: Follow, embed: discord.Embed, semaphore: asyncio.Semaphore):
+    channel = bot.get_partial_messageable(follow.channel_id, guild_id=follow.guild_id)
+    async with semaphore:
+        try:
+            message = await channel.send(content=f"🔔 {follow.team_name} game is under way!", embed=embed)
+        except discord.NotFound:
+            # The channel is gone, so nothing followed there can ever be posted
+            for stale in follow_scheduler.in_channel(follow.channel_id):
+                follow_scheduler.remove(stale.league, stale.team_id, stale.channel_id)
+            print(f"Channel {follow.channel_id} not found, removing its follows")
+            return
+        except discord.Forbidden as e:
+            # Permissions may come back, so the follow stays but this game is not retried
+            follow_scheduler.mark_started(game, follow.channel_id)
+            print(f"Missing permission to start followed game {game.id} in channel {follow.channel_id}: {e}")
+            return
+        except discord.HTTPException as e:
+            # Only this game is re-checked soon; the channel is still pending so it is posted then
+            follow_scheduler.retry(league, game.id)
+            print(f"Error starting followed game {game.id} in channel {follow.channel_id}: {e}")
+            return
+    subscription = game_tracker.add_tracked_message(game.id, message, league, embed=embed)
+    game_tracker.update_game_state(subscription, game)
+    follow_scheduler.mark_started(game, follow.channel_id)
+    FOLLOW_STARTS.labels(league).inc()
+    print(f"Started tracking followed game {game.id} ({follow.team_name}) in channel {follow.channel_id}")
+
+def time_left(deadline: Optional[float]) -> Optional[float]:
+    if deadline is None:
+        return None
+    return max(0.0, deadline - asyncio.get_running_loop().time())
+
+async def fetch_summaries(games: List[Game], league: str, deadline: Optional[float] = None) -> Tuple[Dict[str, Dict], Set[str]]:
+    # Only games about to be redrawn in a detailed embed need their summary, and those share the cache
+    wanted = {}
+    for game in games:
+        detailed = [s for s in game_tracker.subscriptions_for(game.id) if s.detailed]
+        if not detailed:
+            continue
+        version = fingerprint(detailed_render_state(game, league))
+        if any(not s.finalizing if game.completed else s.fingerprint != version for s in detailed):
+            wanted[game.id] = asyncio.create_task(sports_api.fetch_summary(league, game.id, version, game.completed))
+    if not wanted:
+        return {}, set()
+    
+    # Only a short slice of the tick is spent here, so a slow summary cannot hold up the league's other games.
+    # Requests still loading keep going inside SportsAPI and are a cache hit on a later tick
+    budget = SUMMARY_WAIT if deadline is None else min(SUMMARY_WAIT, time_left(deadline))
+    done, pending = await asyncio.wait(wanted.values(), timeout=budget)
+    for task in pending:
+        task.cancel()
+    summaries = {game_id: task.result() for game_id, task in wanted.items() if task in done and not task.exception() and task.result()}
+    return summaries, {game_id for game_id, task in wanted.items() if task in pending}
+
+async def update_league(games: List[Game], league: str, deadline: Optional[float] = None) -> List[str]:
+    dirty: Dict[int, MessageGroup] = {}
+    updated: Dict[int, List[Subscription]] = {}
+    late: List[str] = []
+    
+    summaries, loading = await fetch_summaries(games, league, deadline)
+    
+    for index, game in enumerate(games):
+        if time_left(deadline) == 0:
+            late = [g.id for g in games[index:]]
+            break
+        
+        state = game.render_state()
+        game_fingerprint = fingerprint(state)
+        subscriptions = game_tracker.subscriptions_for(game.id)
+        detailed_state = detailed_fingerprint = None
+        if any(s.detailed for s in subscriptions):
+            detailed_state = detailed_render_state(game, league)
+            detailed_fingerprint = fingerprint(detailed_state)
+        
+        # Render once per view and fan the same embed out to every message following this game;
+        # a finished game is redrawn whatever it last showed, unless its final edit is already queued
+        stale = [
+            s for s in subscriptions
+            if (not s.finalizing if game.completed else s.fingerprint != (detailed_fingerprint if s.detailed else game_fingerprint))
+        ]
+        if not stale:
+            continue
+        embed = None
+        detailed_embed = None
+        # Restored, newly started and edit-failed subscriptions have nothing to diff against
+        prior = next(((s.state, s.detailed) for s in stale if s.state is not None), None)
+        
+        for subscription in stale:
+            if subscription.detailed:
+                if detailed_embed is None:
+                    detailed_embed = create_detailed_embed(game, league, bot.user, summaries.get(game.id))
+                slot_embed = detailed_embed
+            else:
+                if embed is None:
+                    embed = render_game_embed(game, league, bot.user, state)
+                slot_embed = embed
+            group = game_tracker.group_for(subscription)
+            group.set_embed(subscription.slot, slot_embed)
+            dirty[group.message.id] = group
+            updated.setdefault(group.message.id, []).append(subscription)
+            if subscription.detailed and game.id in loading:
+                # Drawn without its summary for now; keeping the old state redraws it once the summary is cached
                 continue
-            
-            current_score = f"{current_game['away_score']}-{current_game['home_score']}"
-            
-            if current_game['completed']:
-                embed = create_game_embed(current_game, league, bot.user)
-                await message.edit(embed=embed)
-                games_to_remove.append(game_id)
-                print(f"Game {game_id} completed and removed from tracking")
-            elif current_score != last_score:
-                embed = create_game_embed(current_game, league, bot.user)
-                await message.edit(embed=embed)
-                game_tracker.update_last_score(game_id, current_score)
-                print(f"Updated score for game {game_id}: {current_score}")
+            if game.completed:
+                subscription.finalizing = True
+            else:
+                game_tracker.update_game_state(subscription, game, detailed_state if subscription.detailed else state)
         
-        except discord.errors.NotFound:
-            games_to_remove.append(game_id)
-            print(f"Message for game {game_id} not found, removing from tracking")
-        except Exception as e:
-            print(f"Error updating game {game_id}: {e}")
+        if game.completed:
+            print(f"Game {game.id} completed; sending its final embed to {len(stale)} message(s)")
+        else:
+            GAMES_UPDATED.labels(league).inc()
+            if prior is None:
+                changed = 'no prior state'
+            else:
+                previous, was_detailed = prior
+                changed = ', '.join(changed_fields(previous, detailed_state if was_detailed else state) or ['redraw'])
+            print(f"Updated game {game.id} in {len(stale)} message(s) ({changed}): {game.away_score}-{game.home_score}")
+    
+    # Restored messages are fetched concurrently and only for as long as the tick has left
+    hydrations = {
+        message_id: asyncio.create_task(hydrate_group(group))
+        for message_id, group in dirty.items() if not group.hydrated
+    }
+    unfinished = set()
+    if hydrations:
+        _, unfinished = await asyncio.wait(hydrations.values(), timeout=time_left(deadline))
+        for task in unfinished:
+            task.cancel()
+    
+    for message_id, group in dirty.items():
+        hydration = hydrations.get(message_id)
+        if hydration in unfinished:
+            # Forget what was rendered so these games are redrawn first next tick
+            for subscription in updated[message_id]:
+                game_tracker.clear_game_state(subscription)
+                late.append(subscription.game_id)
+            continue
+        if hydration is not None and not hydration.result():
+            # Nothing was sent, so these games (final scores included) are drawn again next tick
+            for subscription in updated[message_id]:
+                game_tracker.clear_game_state(subscription)
+            continue
+        # A grouped message is always edited with every embed it holds, so untouched games stay in place
+        edit_scheduler.submit(group.message, group.rendered_embeds(), edit_callback(group, updated[message_id]))
     
-    for game_id in games_to_remove:
-        game_tracker.remove_tracked_message(game_id)
+    return list(dict.fromkeys(late))
+
+async def hydrate_group(group: MessageGroup) -> bool:
+    try:
+        message = await group.message.fetch()
+    except discord.errors.NotFound:
+        for subscription in game_tracker.subscriptions_in(group):
+            game_tracker.remove_subscription(subscription)
+        print(f"Message {group.message.id} not found, removing its games from tracking")
+        return False
+    except discord.HTTPException as e:
+        print(f"Error fetching message {group.message.id}: {e}")
+        return False
+    
+    for slot, embed in enumerate(message.embeds):
+        if slot >= len(group.embeds) or group.embeds[slot] is None:
+            group.set_embed(slot, embed)
+    group.hydrated = True
+    return True
+
+def edit_callback(group: MessageGroup, subscriptions: List[Subscription]):
+    def callback(message: discord.Message, error: Exception):
+        if error is None:
+            # A finished game stays tracked until its final embed has actually been sent
+            for subscription in subscriptions:
+                if subscription.finalizing and game_tracker.remove_subscription(subscription):
+                    if subscription.game_id not in game_tracker.by_game:
+                        GAMES_COMPLETED.labels(subscription.league).inc()
+                    print(f"Game {subscription.game_id} final sent to message {message.id}; removed from tracking")
+            return
+        
+        if isinstance(error, discord.errors.NotFound):
+            removed = sum(game_tracker.remove_subscription(s) for s in game_tracker.subscriptions_in(group))
+            if removed:
+                print(f"Message {message.id} not found, removing {removed} game(s) from tracking")
+        else:
+            # Forget the rendered state so the next tick retries the edit
+            for subscription in subscriptions:
+                game_tracker.clear_game_state(subscription)
+            print(f"Error updating message {message.id}: {error}")
+    return callback
 
 @update_scores.before_loop
 async def before_update_scores():
@@ -77,6 +388,7 @@ async def before_update_scores():
 
 @bot.event
 async def on_command_error(ctx, error):
+    COMMAND_ERRORS.labels(type(error).__name__).inc()
     if isinstance(error, commands.CommandNotFound):
         error_embed = discord.Embed(
             description="❌ Command not found. Use `!help_sports` for available commands.",
@@ -122,11 +434,19 @@ async def on_command_error(ctx, error):
         print(f"Error: {error}")
 
 async def main():
+    metrics_runner = await start_metrics_server() if METRICS_PORT else None
     async with bot:
         try:
             await bot.start(DISCORD_TOKEN)
         finally:
             await sports_api.close_session()
+            tracking_store.close()
+            if sports_api.archive:
+                sports_api.archive.close()
+            if sports_api.recorder:
+                sports_api.recorder.close()
+            if metrics_runner:
+                await metrics_runner.cleanup()
 
 if __name__ == '__main__':
     asyncio.run(main())
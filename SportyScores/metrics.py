@@ -0,0 +1,255 @@
+import asyncio
+import bisect
+import functools
+import time
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+from aiohttp import web
+from config import METRICS_HOST, METRICS_PORT
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+# Seconds; spans a cached parse (sub-millisecond) up to a fully retried ESPN request
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+LabelValues = Tuple[str, ...]
+# A scrape-time callback returns a bare value for unlabelled metrics or {label values: value}
+MetricFunction = Callable[[], Union[float, Dict[LabelValues, float]]]
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ''
+    return '{' + ','.join(f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)) + '}'
+
+def _format_value(value: float) -> str:
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value))
+
+class CounterValue:
+    __slots__ = ('value',)
+    
+    def __init__(self):
+        self.value = 0.0
+    
+    def inc(self, amount: float = 1):
+        self.value += amount
+
+class GaugeValue:
+    __slots__ = ('value',)
+    
+    def __init__(self):
+        self.value = 0.0
+    
+    def set(self, value: float):
+        self.value = value
+    
+    def inc(self, amount: float = 1):
+        self.value += amount
+    
+    def dec(self, amount: float = 1):
+        self.value -= amount
+
+class Timer:
+    __slots__ = ('histogram', 'start')
+    
+    def __init__(self, histogram: 'HistogramValue'):
+        self.histogram = histogram
+        self.start = 0.0
+    
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.histogram.observe(time.perf_counter() - self.start)
+
+class HistogramValue:
+    __slots__ = ('bounds', 'counts', 'sum', 'count')
+    
+    def __init__(self, bounds: Tuple[float, ...]):
+        self.bounds = bounds
+        # Per-bucket counts plus one overflow slot; made cumulative only when scraped
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+    
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+    
+    def time(self) -> Timer:
+        return Timer(self)
+
+class Metric:
+    kind = 'untyped'
+    value_type = CounterValue
+    
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (), function: Optional[MetricFunction] = None):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.function = function
+        self._values: Dict[LabelValues, object] = {}
+    
+    def _new_value(self):
+        return self.value_type()
+    
+    def labels(self, *values: str):
+        if len(values) != len(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {values}")
+        value = self._values.get(values)
+        if value is None:
+            value = self._values[values] = self._new_value()
+        return value
+    
+    def set_function(self, function: Optional[MetricFunction]):
+        self.function = function
+    
+    def _current(self) -> Dict[LabelValues, float]:
+        if self.function is None:
+            return {labels: value.value for labels, value in self._values.items()}
+        result = self.function()
+        return result if isinstance(result, dict) else {(): result}
+    
+    def samples(self) -> Iterator[Tuple[str, Sequence[str], Sequence[str], float]]:
+        for labels, value in self._current().items():
+            yield self.name, self.labelnames, labels, value
+    
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        for name, labelnames, labels, value in self.samples():
+            lines.append(f"{name}{_format_labels(labelnames, labels)} {_format_value(value)}")
+        return lines
+
+class Counter(Metric):
+    kind = 'counter'
+    value_type = CounterValue
+    
+    def inc(self, amount: float = 1):
+        self.labels().inc(amount)
+
+class Gauge(Metric):
+    kind = 'gauge'
+    value_type = GaugeValue
+    
+    def set(self, value: float):
+        self.labels().set(value)
+    
+    def inc(self, amount: float = 1):
+        self.labels().inc(amount)
+    
+    def dec(self, amount: float = 1):
+        self.labels().dec(amount)
+
+class Histogram(Metric):
+    kind = 'histogram'
+    
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+    
+    def _new_value(self) -> HistogramValue:
+        return HistogramValue(self.buckets)
+    
+    def observe(self, value: float):
+        self.labels().observe(value)
+    
+    def time(self) -> Timer:
+        return self.labels().time()
+    
+    def samples(self) -> Iterator[Tuple[str, Sequence[str], Sequence[str], float]]:
+        bucket_labels = self.labelnames + ('le',)
+        for labels, value in list(self._values.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float('inf'),), value.counts):
+                cumulative += count
+                yield f"{self.name}_bucket", bucket_labels, labels + (_format_value(bound),), cumulative
+            yield f"{self.name}_sum", self.labelnames, labels, value.sum
+            yield f"{self.name}_count", self.labelnames, labels, value.count
+
+class MetricsRegistry:
+    def __init__(self):
+        self._metrics: Dict[str, Metric] = {}
+    
+    def register(self, metric: Metric) -> Metric:
+        existing = self._metrics.get(metric.name)
+        if existing is not None:
+            # Re-registering the same metric (e.g. a module imported twice) hands back the live one
+            if type(existing) is not type(metric) or existing.labelnames != metric.labelnames:
+                raise ValueError(f"Metric {metric.name} is already registered with a different type or labels")
+            return existing
+        self._metrics[metric.name] = metric
+        return metric
+    
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = (), function: Optional[MetricFunction] = None) -> Counter:
+        return self.register(Counter(name, documentation, labelnames, function))
+    
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = (), function: Optional[MetricFunction] = None) -> Gauge:
+        return self.register(Gauge(name, documentation, labelnames, function))
+    
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+    
+    def get(self, name: str) -> Optional[Metric]:
+        return self._metrics.get(name)
+    
+    def render(self) -> str:
+        lines = []
+        for metric in self._metrics.values():
+            try:
+                lines.extend(metric.render())
+            except Exception as e:
+                # One broken scrape-time callback must not blank out every other metric
+                print(f"Error collecting metric {metric.name}: {e}")
+        return '\n'.join(lines) + '\n'
+
+REGISTRY = MetricsRegistry()
+
+def timed(histogram: Histogram, *label_values: str):
+    # The labelled value is resolved once here so each call only pays for two clock reads
+    value = histogram.labels(*label_values)
+    
+    def decorator(fn):
+        if asyncio.iscoroutinefunction(fn):
+            @functools.wraps(fn)
+            async def async_wrapper(*args, **kwargs):
+                start = time.perf_counter()
+                try:
+                    return await fn(*args, **kwargs)
+                finally:
+                    value.observe(time.perf_counter() - start)
+            return async_wrapper
+        
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                value.observe(time.perf_counter() - start)
+        return wrapper
+    return decorator
+
+REGISTRY_KEY = web.AppKey('registry', MetricsRegistry)
+
+async def handle_metrics(request: web.Request) -> web.Response:
+    registry = request.app[REGISTRY_KEY]
+    return web.Response(body=registry.render().encode(), headers={'Content-Type': CONTENT_TYPE})
+
+async def start_metrics_server(registry: MetricsRegistry = REGISTRY, host: str = METRICS_HOST, port: int = METRICS_PORT) -> Optional[web.AppRunner]:
+    app = web.Application()
+    app[REGISTRY_KEY] = registry
+    app.router.add_get('/metrics', handle_metrics)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    try:
+        await web.TCPSite(runner, host, port).start()
+    except OSError as e:
+        await runner.cleanup()
+        print(f"Error starting metrics endpoint on {host}:{port}: {e}")
+        return None
+    return runner
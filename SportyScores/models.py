@@ -0,0 +1,179 @@
+import hashlib
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, List, Optional, Set, Tuple
+
+# Exactly the fields create_game_embed reads; anything else changing does not need a message edit
+RENDER_FIELDS = (
+    'home_team', 'away_team', 'home_team_abbr', 'away_team_abbr', 'home_team_color',
+    'home_score', 'away_score', 'detail', 'completed', 'period', 'clock',
+    'home_record', 'away_record'
+)
+# Detailed embeds also show the live situation and the line scores, which change without any render field changing
+DETAILED_FIELDS = RENDER_FIELDS + ('situation', 'away_linescores', 'home_linescores')
+
+def fingerprint(state: Tuple) -> str:
+    return hashlib.blake2b(repr(state).encode(), digest_size=8).hexdigest()
+
+def changed_fields(old_state: Optional[Tuple], new_state: Tuple) -> List[str]:
+    if old_state is None:
+        return list(RENDER_FIELDS)
+    return [name for name, old, new in zip(DETAILED_FIELDS, old_state, new_state) if old != new]
+
+@dataclass(slots=True)
+class Game:
+    id: str
+    league: str
+    home_team: str
+    away_team: str
+    home_team_id: str
+    away_team_id: str
+    home_team_abbr: str
+    away_team_abbr: str
+    home_team_color: str
+    home_score: str
+    away_score: str
+    detail: str
+    completed: bool
+    period: int
+    clock: str
+    home_record: str
+    away_record: str
+    # Raw ESPN subtrees; everything below is read from these only when accessed
+    event: Dict = field(repr=False, compare=False)
+    competition: Dict = field(repr=False, compare=False)
+    home: Dict = field(repr=False, compare=False)
+    away: Dict = field(repr=False, compare=False)
+    
+    @property
+    def name(self) -> str:
+        return self.event.get('name', '')
+    
+    @property
+    def short_name(self) -> str:
+        return self.event.get('shortName', '')
+    
+    @property
+    def status(self) -> str:
+        return self.competition['status']['type']['description']
+    
+    @property
+    def state(self) -> str:
+        return self.competition['status']['type'].get('state', '')
+    
+    @property
+    def status_name(self) -> str:
+        return self.competition['status']['type'].get('name', '')
+    
+    @property
+    def start_time(self) -> Optional[datetime]:
+        try:
+            return datetime.fromisoformat(self.event['date'])
+        except (KeyError, ValueError):
+            return None
+    
+    @property
+    def clock_seconds(self) -> Optional[float]:
+        clock = self.competition['status'].get('clock')
+        if clock is not None:
+            return float(clock)
+        try:
+            minutes, _, seconds = self.clock.rpartition(':')
+            return int(minutes or 0) * 60 + float(seconds)
+        except ValueError:
+            return None
+    
+    @property
+    def home_team_logo(self) -> str:
+        return self.home['team'].get('logo', '')
+    
+    @property
+    def away_team_logo(self) -> str:
+        return self.away['team'].get('logo', '')
+    
+    @property
+    def away_team_color(self) -> str:
+        return self.away['team'].get('color', '000000')
+    
+    @property
+    def home_linescores(self) -> List[Dict]:
+        return self.home.get('linescores', [])
+    
+    @property
+    def away_linescores(self) -> List[Dict]:
+        return self.away.get('linescores', [])
+    
+    @property
+    def home_stats(self) -> List[Dict]:
+        return self.home.get('statistics', [])
+    
+    @property
+    def away_stats(self) -> List[Dict]:
+        return self.away.get('statistics', [])
+    
+    @property
+    def situation(self) -> Dict:
+        return self.competition.get('situation', {})
+    
+    @property
+    def venue(self) -> str:
+        return self.competition.get('venue', {}).get('fullName', 'TBD')
+    
+    @property
+    def broadcast(self) -> str:
+        broadcasts = self.competition.get('broadcasts')
+        if not broadcasts:
+            return 'Not Available'
+        return broadcasts[0].get('names', ['Not Available'])[0]
+    
+    @property
+    def odds_details(self) -> str:
+        odds = self.competition.get('odds')
+        return odds[0].get('details', '') if odds else ''
+    
+    @property
+    def overunder(self) -> str:
+        odds = self.competition.get('odds')
+        return odds[0].get('overUnder', '') if odds else ''
+    
+    @property
+    def attendance(self) -> int:
+        return self.competition.get('attendance', 0)
+    
+    def render_state(self) -> Tuple:
+        return tuple(getattr(self, name) for name in RENDER_FIELDS)
+
+@dataclass(slots=True, eq=False)
+class Subscription:
+    game_id: str
+    league: str
+    guild_id: Optional[int]
+    channel_id: int
+    message: object = field(repr=False)
+    slot: int = 0
+    state: Optional[Tuple] = field(default=None, repr=False)
+    fingerprint: Optional[str] = None
+    # Detailed subscriptions show the box score, situation and summary stats instead of the compact embed
+    detailed: bool = False
+    # A final embed is queued; the subscription is removed once Discord accepts the edit
+    finalizing: bool = False
+    
+    @property
+    def key(self) -> Tuple[str, int]:
+        return (self.game_id, self.message.id)
+
+@dataclass(slots=True, eq=False)
+class MessageGroup:
+    message: object = field(repr=False)
+    # One embed per slot; slots of completed games keep their final embed so later edits do not drop them
+    embeds: List[Optional[object]] = field(default_factory=list, repr=False)
+    keys: Set[Tuple[str, int]] = field(default_factory=set)
+    hydrated: bool = True
+    
+    def set_embed(self, slot: int, embed: Optional[object]):
+        if slot >= len(self.embeds):
+            self.embeds.extend([None] * (slot + 1 - len(self.embeds)))
+        self.embeds[slot] = embed
+    
+    def rendered_embeds(self) -> List[object]:
+        return [embed for embed in self.embeds if embed is not None]
@@ -0,0 +1,110 @@
+import time
+from datetime import datetime, timezone
+from typing import Callable, Dict, Iterable, List, Optional
+from config import (
+    UPDATE_INTERVAL, POLL_CRUNCH_INTERVAL, POLL_BREAK_INTERVAL, POLL_PREGAME_INTERVAL,
+    POLL_PREGAME_WINDOW, POLL_IDLE_INTERVAL, POLL_CRUNCH_CLOCK
+)
+from leagues import LEAGUES
+from models import Game
+
+BREAK_STATUSES = {'STATUS_HALFTIME', 'STATUS_END_PERIOD', 'STATUS_DELAYED', 'STATUS_RAIN_DELAY'}
+
+def is_crunch_time(game: Game) -> bool:
+    league = LEAGUES.get(game.league)
+    if league is None:
+        return False
+    
+    if game.period < league.final_period:
+        # Late in any period the clock and score move fastest
+        if not league.clock_based:
+            return False
+        clock = game.clock_seconds
+        return clock is not None and clock <= POLL_CRUNCH_CLOCK
+    
+    try:
+        margin = abs(int(game.home_score) - int(game.away_score))
+    except ValueError:
+        return True
+    return margin <= league.close_margin
+
+def game_poll_interval(game: Game, now: Optional[datetime] = None) -> float:
+    if game.completed:
+        return POLL_IDLE_INTERVAL
+    
+    if game.state == 'pre' or game.period == 0:
+        start = game.start_time
+        if start is None:
+            return POLL_PREGAME_INTERVAL
+        now = now or datetime.now(timezone.utc)
+        until_window = (start - now).total_seconds() - POLL_PREGAME_WINDOW
+        # Sleep until the pre-game window opens, then poll often enough to catch kickoff
+        return min(POLL_IDLE_INTERVAL, max(POLL_PREGAME_INTERVAL, until_window))
+    
+    if game.status_name in BREAK_STATUSES:
+        return POLL_BREAK_INTERVAL
+    if is_crunch_time(game):
+        return POLL_CRUNCH_INTERVAL
+    return UPDATE_INTERVAL
+
+def league_poll_interval(games: Iterable[Game], now: Optional[datetime] = None) -> float:
+    now = now or datetime.now(timezone.utc)
+    return min((game_poll_interval(game, now) for game in games), default=POLL_IDLE_INTERVAL)
+
+class PollScheduler:
+    def __init__(self):
+        # Replay runs the schedule on the recording's clock; both default to real time
+        self.clock: Callable[[], float] = time.monotonic
+        self.wall_clock: Callable[[], float] = time.time
+        self.next_poll: Dict[str, float] = {}
+        self.intervals: Dict[str, float] = {}
+        self.scheduled_ids: Dict[str, frozenset] = {}
+        # league -> game ids a deadline-bounded tick did not get to, in the order they should be retried
+        self.carryover: Dict[str, List[str]] = {}
+    
+    def due(self, games_by_league: Dict[str, List[str]], now: Optional[float] = None) -> List[str]:
+        now = self.clock() if now is None else now
+        leagues = [
+            league for league, game_ids in games_by_league.items()
+            # A newly tracked game may need a faster cadence than the one already scheduled
+            if league in self.carryover or self.next_poll.get(league, 0) <= now
+            or self.scheduled_ids.get(league) != frozenset(game_ids)
+        ]
+        # Work left over from an overrun tick goes first so it cannot be starved twice
+        leagues.sort(key=lambda league: league not in self.carryover)
+        return leagues
+    
+    def schedule(self, league: str, game_ids: List[str], games: List[Game], now: Optional[float] = None) -> float:
+        now = self.clock() if now is None else now
+        interval = league_poll_interval(games, datetime.fromtimestamp(self.wall_clock(), timezone.utc))
+        self.intervals[league] = interval
+        self.scheduled_ids[league] = frozenset(game_ids)
+        self.next_poll[league] = now + interval
+        return interval
+    
+    def retry(self, league: str, game_ids: List[str], delay: float, now: Optional[float] = None):
+        now = self.clock() if now is None else now
+        self.scheduled_ids[league] = frozenset(game_ids)
+        self.next_poll[league] = now + delay
+    
+    def defer(self, league: str, game_ids: List[str]):
+        # An empty carryover would still make the league due every tick
+        if not game_ids:
+            return
+        carried = self.carryover.setdefault(league, [])
+        carried.extend(game_id for game_id in game_ids if game_id not in carried)
+    
+    def take_carryover(self, league: str) -> List[str]:
+        return self.carryover.pop(league, [])
+    
+    def reset(self, league: Optional[str] = None):
+        if league is None:
+            self.next_poll.clear()
+            self.intervals.clear()
+            self.scheduled_ids.clear()
+            self.carryover.clear()
+        else:
+            self.next_poll.pop(league, None)
+            self.intervals.pop(league, None)
+            self.scheduled_ids.pop(league, None)
+            self.carryover.pop(league, None)
@@ -0,0 +1,97 @@
+import asyncio
+import os
+import stat
+from datetime import date
+from typing import Dict, Optional, Set
+from config import POLLER_SOCKET, POLLER_READ_LIMIT, METRICS_PORT
+from sports_api import SportsAPI, json_loads
+from sharding import encode_message
+from scoreboard_archive import ScoreboardArchive
+from metrics import REGISTRY, start_metrics_server
+
+SHARD_CONNECTIONS = REGISTRY.gauge('sportyscores_poller_connections', 'Shard processes connected to the poller')
+SHARD_REQUESTS = REGISTRY.counter('sportyscores_poller_served_total', 'Scoreboard requests served to shard processes', ('league',))
+
+class PollerServer:
+    def __init__(self, sports_api: SportsAPI, path: str = POLLER_SOCKET):
+        self.sports_api = sports_api
+        self.path = path
+        self.server: Optional[asyncio.AbstractServer] = None
+        self.connections: Set[asyncio.StreamWriter] = set()
+    
+    async def start(self):
+        # A socket file left behind by a crashed poller would make the bind fail
+        if os.path.exists(self.path) and stat.S_ISSOCK(os.stat(self.path).st_mode):
+            os.unlink(self.path)
+        self.server = await asyncio.start_unix_server(self.handle_shard, self.path, limit=POLLER_READ_LIMIT)
+    
+    async def close(self):
+        if self.server:
+            self.server.close()
+            for writer in list(self.connections):
+                writer.close()
+            await self.server.wait_closed()
+            self.server = None
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+    
+    async def handle_shard(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        SHARD_CONNECTIONS.inc()
+        self.connections.add(writer)
+        requests = set()
+        try:
+            while line := await reader.readline():
+                # Requests are answered as they finish, so one slow league does not hold up the rest
+                task = asyncio.create_task(self.answer(json_loads(line), writer))
+                requests.add(task)
+                task.add_done_callback(requests.discard)
+        except (ConnectionError, ValueError) as e:
+            print(f"Error reading from shard: {e}")
+        finally:
+            SHARD_CONNECTIONS.dec()
+            self.connections.discard(writer)
+            for task in requests:
+                task.cancel()
+            writer.close()
+    
+    async def answer(self, request: Dict, writer: asyncio.StreamWriter):
+        data = None
+        if request.get('op') == 'scores':
+            league = request.get('league', '')
+            SHARD_REQUESTS.labels(league).inc()
+            if request.get('date'):
+                data = await self.sports_api.fetch_scores_on(league, date.fromisoformat(request['date']))
+            else:
+                data = await self.sports_api.fetch_scores(league, max_age=request.get('max_age'))
+        elif request.get('op') == 'teams':
+            data = await self.sports_api.fetch_teams(request.get('league', ''))
+        elif request.get('op') == 'summary':
+            data = await self.sports_api.fetch_summary(
+                request.get('league', ''), str(request.get('event', '')), request.get('version', ''), bool(request.get('completed'))
+            )
+        
+        if writer.is_closing():
+            return
+        try:
+            writer.write(encode_message({'id': request.get('id'), 'data': data}))
+            await writer.drain()
+        except ConnectionError as e:
+            print(f"Error answering shard: {e}")
+
+async def main():
+    sports_api = SportsAPI(archive=ScoreboardArchive())
+    server = PollerServer(sports_api)
+    await server.start()
+    metrics_runner = await start_metrics_server() if METRICS_PORT else None
+    print(f'Poller listening on {server.path}')
+    try:
+        await server.server.serve_forever()
+    finally:
+        await server.close()
+        await sports_api.close_session()
+        sports_api.archive.close()
+        if metrics_runner:
+            await metrics_runner.cleanup()
+
+if __name__ == '__main__':
+    asyncio.run(main())
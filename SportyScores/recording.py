@@ -0,0 +1,121 @@
+import bisect
+import glob
+import gzip
+import json
+import os
+import time
+import zlib
+from datetime import date
+from typing import Dict, Iterator, List, Optional, Tuple
+from sports_api import SportsAPI, json_loads
+
+RECORDING_PATTERN = 'scoreboards-*.jsonl.gz'
+GZIP_WBITS = zlib.MAX_WBITS | 16
+READ_CHUNK = 4096
+
+def recording_files(path: str) -> List[str]:
+    if os.path.isdir(path):
+        return sorted(glob.glob(os.path.join(path, RECORDING_PATTERN)))
+    return [path]
+
+def read_lines(file_path: str) -> Iterator[bytes]:
+    # Decompressed incrementally rather than with gzip.open so a damaged or truncated tail,
+    # e.g. from a recorder killed mid-write, still yields every complete record before it
+    decompressor = zlib.decompressobj(GZIP_WBITS)
+    buffer = b''
+    with open(file_path, 'rb') as f:
+        while chunk := f.read(READ_CHUNK):
+            while chunk:
+                buffer += decompressor.decompress(chunk)
+                # Each recorder session appends its own gzip member
+                chunk = decompressor.unused_data
+                if decompressor.eof:
+                    decompressor = zlib.decompressobj(GZIP_WBITS)
+            *lines, buffer = buffer.split(b'\n')
+            yield from lines
+
+def read_records(path: str) -> Iterator[Tuple[float, str, Dict]]:
+    for file_path in recording_files(path):
+        try:
+            for line in read_lines(file_path):
+                record = json_loads(line)
+                yield record['t'], record['league'], record['data']
+        except (zlib.error, ValueError, KeyError) as e:
+            print(f"Stopped reading {file_path} at a damaged record: {e}")
+
+class SnapshotRecorder:
+    def __init__(self, directory: str):
+        os.makedirs(directory, exist_ok=True)
+        self.path = os.path.join(directory, time.strftime('scoreboards-%Y%m%d-%H%M%S.jsonl.gz'))
+        self._file = gzip.open(self.path, 'ab')
+        self.records = 0
+    
+    def record(self, league: str, data: Dict, timestamp: Optional[float] = None):
+        line = json.dumps({'t': time.time() if timestamp is None else timestamp, 'league': league, 'data': data}, separators=(',', ':'))
+        self._file.write(line.encode() + b'\n')
+        # Sync-flush each record so a crash loses at most the one being written
+        self._file.flush()
+        self.records += 1
+    
+    def close(self):
+        if not self._file.closed:
+            self._file.close()
+
+class ReplayClock:
+    def __init__(self, origin: float, speed: float = 1.0):
+        self.origin = origin
+        self.speed = speed
+        self.started = time.monotonic()
+    
+    def __call__(self) -> float:
+        return self.origin + (time.monotonic() - self.started) * self.speed
+    
+    def restart(self):
+        self.started = time.monotonic()
+
+class ReplaySportsAPI(SportsAPI):
+    def __init__(self, path: str, speed: float = 1.0, **kwargs):
+        super().__init__(**kwargs)
+        # league -> parallel lists of timestamps and scoreboards, oldest first
+        self.timelines: Dict[str, Tuple[List[float], List[Dict]]] = {}
+        for timestamp, league, data in sorted(read_records(path), key=lambda record: record[0]):
+            times, snapshots = self.timelines.setdefault(league, ([], []))
+            times.append(timestamp)
+            snapshots.append(data)
+        if not self.timelines:
+            raise ValueError(f"No scoreboard recordings found at {path}")
+        
+        self.start = min(times[0] for times, _ in self.timelines.values())
+        self.end = max(times[-1] for times, _ in self.timelines.values())
+        self.clock = ReplayClock(self.start, speed)
+    
+    @property
+    def finished(self) -> bool:
+        return self.clock() > self.end
+    
+    def snapshot_at(self, league: str, timestamp: float) -> Optional[Dict]:
+        timeline = self.timelines.get(league)
+        if timeline is None:
+            return None
+        times, snapshots = timeline
+        # Before a league's first recording, serve that first scoreboard rather than nothing
+        return snapshots[max(0, bisect.bisect_right(times, timestamp) - 1)]
+    
+    async def create_session(self):
+        pass
+    
+    async def close_session(self):
+        pass
+    
+    async def _request_teams(self, league: str) -> Optional[List[Dict]]:
+        return None
+    
+    async def _request_summary(self, league: str, game_id: str, version: str = '', completed: bool = False) -> Optional[Dict]:
+        return None
+    
+    async def _request_scores(self, league: str, day: Optional[date] = None) -> Optional[Dict]:
+        # Recordings only hold the live scoreboard, so there is nothing to serve for other days
+        if day:
+            return None
+        # Unchanged stretches return the same object, just like a 304, so parse memoization still applies
+        return self.snapshot_at(league, self.clock())
@@ -0,0 +1,104 @@
+import asyncio
+import json
+import sqlite3
+import zlib
+from datetime import date
+from typing import Dict, Optional
+from config import ARCHIVE_DB_PATH
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS scoreboards (
+    league TEXT NOT NULL,
+    day TEXT NOT NULL,
+    body BLOB NOT NULL,
+    PRIMARY KEY (league, day)
+)
+'''
+
+SUMMARIES_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS summaries (
+    league TEXT NOT NULL,
+    game_id TEXT NOT NULL,
+    body BLOB NOT NULL,
+    PRIMARY KEY (league, game_id)
+)
+'''
+
+def is_final(data: Dict) -> bool:
+    # Postponed and cancelled games also end up in the post state, so a day with only those is still final
+    return all(
+        event['competitions'][0]['status']['type'].get('state') == 'post'
+        for event in data.get('events', [])
+    )
+
+class ScoreboardArchive:
+    def __init__(self, path: str = ARCHIVE_DB_PATH):
+        self.path = path
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.execute(SCHEMA)
+        self.conn.execute(SUMMARIES_SCHEMA)
+        self.conn.commit()
+        self._lock = asyncio.Lock()
+    
+    def get_sync(self, league: str, day: date) -> Optional[Dict]:
+        row = self.conn.execute(
+            'SELECT body FROM scoreboards WHERE league = ? AND day = ?', (league, day.isoformat())
+        ).fetchone()
+        return json.loads(zlib.decompress(row[0])) if row else None
+    
+    def put_sync(self, league: str, day: date, data: Dict):
+        body = zlib.compress(json.dumps(data, separators=(',', ':')).encode())
+        with self.conn:
+            self.conn.execute(
+                'INSERT OR REPLACE INTO scoreboards (league, day, body) VALUES (?, ?, ?)',
+                (league, day.isoformat(), body)
+            )
+    
+    def get_summary_sync(self, league: str, game_id: str) -> Optional[Dict]:
+        row = self.conn.execute(
+            'SELECT body FROM summaries WHERE league = ? AND game_id = ?', (league, game_id)
+        ).fetchone()
+        return json.loads(zlib.decompress(row[0])) if row else None
+    
+    def put_summary_sync(self, league: str, game_id: str, data: Dict):
+        body = zlib.compress(json.dumps(data, separators=(',', ':')).encode())
+        with self.conn:
+            self.conn.execute(
+                'INSERT OR REPLACE INTO summaries (league, game_id, body) VALUES (?, ?, ?)',
+                (league, game_id, body)
+            )
+    
+    async def get_summary(self, league: str, game_id: str) -> Optional[Dict]:
+        async with self._lock:
+            try:
+                return await asyncio.to_thread(self.get_summary_sync, league, game_id)
+            except (sqlite3.Error, zlib.error, ValueError) as e:
+                print(f"Error reading archived {league.upper()} summary for game {game_id}: {e}")
+                return None
+    
+    async def put_summary(self, league: str, game_id: str, data: Dict):
+        async with self._lock:
+            try:
+                await asyncio.to_thread(self.put_summary_sync, league, game_id, data)
+            except sqlite3.Error as e:
+                print(f"Error archiving {league.upper()} summary for game {game_id}: {e}")
+    
+    async def get(self, league: str, day: date) -> Optional[Dict]:
+        async with self._lock:
+            try:
+                return await asyncio.to_thread(self.get_sync, league, day)
+            except (sqlite3.Error, zlib.error, ValueError) as e:
+                print(f"Error reading archived {league.upper()} scoreboard for {day}: {e}")
+                return None
+    
+    async def put(self, league: str, day: date, data: Dict):
+        async with self._lock:
+            try:
+                await asyncio.to_thread(self.put_sync, league, day, data)
+            except sqlite3.Error as e:
+                print(f"Error archiving {league.upper()} scoreboard for {day}: {e}")
+    
+    def close(self):
+        self.conn.close()
@@ -0,0 +1,118 @@
+import asyncio
+import json
+from datetime import date
+from typing import Dict, Iterable, List, Optional
+from config import POLLER_SOCKET, POLLER_TIMEOUT, POLLER_READ_LIMIT, POLL_TICK
+from sports_api import SportsAPI, json_loads
+from metrics import REGISTRY
+
+POLLER_REQUESTS = REGISTRY.counter('sportyscores_poller_requests_total', 'Scoreboard requests sent to the shared poller, by result', ('league', 'result'))
+
+def shard_for_guild(guild_id: Optional[int], shard_count: int) -> int:
+    # Discord's own routing: direct messages always arrive on shard 0
+    if guild_id is None:
+        return 0
+    return (guild_id >> 22) % shard_count
+
+def owns_guild(guild_id: Optional[int], shard_count: int, shard_ids: Optional[Iterable[int]]) -> bool:
+    if not shard_count or shard_ids is None:
+        return True
+    return shard_for_guild(guild_id, shard_count) in shard_ids
+
+def encode_message(message: Dict) -> bytes:
+    return json.dumps(message, separators=(',', ':')).encode() + b'\n'
+
+# Shard processes read scoreboards from the poller instead of ESPN. Only the transport changes:
+# the TTL cache, single-flight requests, stale fallback and parse memoization all still apply,
+# and the poller's own cache means shards asking for the same league share one ESPN request.
+class RemoteSportsAPI(SportsAPI):
+    def __init__(self, path: str = POLLER_SOCKET, max_age: float = POLL_TICK, **kwargs):
+        super().__init__(**kwargs)
+        self.path = path
+        self.max_age = max_age
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._reader_task: Optional[asyncio.Task] = None
+        self._responses: Dict[int, asyncio.Future] = {}
+        self._next_id = 0
+        self._connect_lock = asyncio.Lock()
+    
+    @property
+    def connected(self) -> bool:
+        return self._writer is not None and not self._writer.is_closing()
+    
+    async def create_session(self):
+        async with self._connect_lock:
+            if self.connected:
+                return
+            self._reader, self._writer = await asyncio.open_unix_connection(self.path, limit=POLLER_READ_LIMIT)
+            self._reader_task = asyncio.create_task(self._read_responses(self._reader))
+    
+    async def close_session(self):
+        if self._reader_task:
+            self._reader_task.cancel()
+            self._reader_task = None
+        if self._writer:
+            self._writer.close()
+            self._writer = None
+        self._fail_pending(ConnectionError('Poller connection closed'))
+    
+    def _fail_pending(self, error: Exception):
+        for future in self._responses.values():
+            if not future.done():
+                future.set_exception(error)
+        self._responses.clear()
+    
+    async def _read_responses(self, reader: asyncio.StreamReader):
+        try:
+            while line := await reader.readline():
+                response = json_loads(line)
+                future = self._responses.pop(response.get('id'), None)
+                if future is not None and not future.done():
+                    future.set_result(response.get('data'))
+        except (ConnectionError, ValueError) as e:
+            print(f"Error reading from poller: {e}")
+        finally:
+            # Requests still waiting fail now; the next request reconnects
+            if self._reader is reader:
+                self._writer = None
+                self._fail_pending(ConnectionError('Poller connection lost'))
+    
+    async def _request_scores(self, league: str, day: Optional[date] = None) -> Optional[Dict]:
+        request = {'op': 'scores', 'league': league, 'max_age': self.max_age}
+        if day:
+            request['date'] = day.isoformat()
+        return await self._ask(league, request)
+    
+    async def _request_teams(self, league: str) -> Optional[List[Dict]]:
+        return await self._ask(league, {'op': 'teams', 'league': league})
+    
+    async def _request_summary(self, league: str, game_id: str, version: str = '', completed: bool = False) -> Optional[Dict]:
+        # The poller keeps its own summary cache, so shards asking about the same game share one download
+        return await self._ask(league, {'op': 'summary', 'league': league, 'event': game_id, 'version': version, 'completed': completed})
+    
+    async def _ask(self, league: str, request: Dict):
+        try:
+            await self.create_session()
+        except OSError as e:
+            POLLER_REQUESTS.labels(league, 'unavailable').inc()
+            print(f"Error connecting to poller at {self.path}: {e}")
+            return None
+        
+        self._next_id += 1
+        request_id = self._next_id
+        future = asyncio.get_running_loop().create_future()
+        self._responses[request_id] = future
+        try:
+            self._writer.write(encode_message({'id': request_id, **request}))
+            await self._writer.drain()
+            data = await asyncio.wait_for(future, POLLER_TIMEOUT)
+        except (ConnectionError, asyncio.TimeoutError) as e:
+            POLLER_REQUESTS.labels(league, 'error').inc()
+            print(f"Error fetching {league.upper()} {request['op']} from poller: {str(e) or type(e).__name__}")
+            return None
+        finally:
+            self._responses.pop(request_id, None)
+        
+        POLLER_REQUESTS.labels(league, 'ok' if data is not None else 'empty').inc()
+        return data
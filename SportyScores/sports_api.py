@@ -1,39 +1,502 @@
+import asyncio
+import json
+import random
+import time
 import aiohttp
-from typing import Dict, List, Optional
-from config import ESPN_API_URLS
+from collections import OrderedDict
+from datetime import date, datetime, timezone
+from typing import AsyncIterator, Callable, Dict, Iterable, List, Optional, Tuple
+from models import Game
+from leagues import LEAGUES
+from metrics import REGISTRY
+from scoreboard_archive import is_final
+from game_events import EventQueue, GameEvent, LeagueFeed
+from team_index import TeamIndex, TeamDirectory
+from config import (
+    ESPN_API_BASE, ESPN_TIMEZONE, POLL_TICK, SCORES_CACHE_TTL, SCORES_SELECTIVE_DECODE,
+    FETCH_CONCURRENCY, WATCH_QUEUE_SIZE, SUMMARY_LIVE_INTERVAL, SUMMARY_IDLE_TTL, SUMMARY_CACHE_SIZE,
+    HTTP_POOL_LIMIT, HTTP_POOL_LIMIT_PER_HOST, HTTP_KEEPALIVE_TIMEOUT, HTTP_DNS_CACHE_TTL,
+    HTTP_CONNECT_TIMEOUT, HTTP_READ_TIMEOUT, HTTP_TOTAL_TIMEOUT,
+    HTTP_MAX_RETRIES, HTTP_BACKOFF_BASE, HTTP_BACKOFF_MAX
+)
+
+try:
+    import brotli  # noqa: F401 - aiohttp decodes br bodies when this is installed
+    ACCEPT_ENCODING = 'br, gzip, deflate'
+except ImportError:
+    ACCEPT_ENCODING = 'gzip, deflate'
+
+try:
+    from zoneinfo import ZoneInfo
+    ESPN_TZ = ZoneInfo(ESPN_TIMEZONE)
+except (ImportError, KeyError):
+    # No tz database available; UTC is off by a few hours around midnight at worst
+    ESPN_TZ = timezone.utc
+
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
+EVENT_KEYS = ('id', 'name', 'shortName', 'date')
+COMPETITION_KEYS = ('status', 'competitors', 'venue', 'broadcasts', 'odds', 'situation', 'attendance')
+COMPETITOR_KEYS = ('homeAway', 'score', 'team', 'linescores', 'records', 'statistics')
+
+ESPN_REQUESTS = REGISTRY.counter(
+    'sportyscores_espn_requests_total', 'ESPN scoreboard responses by status (error for timeouts and connection failures)', ('league', 'status')
+)
+ESPN_REQUEST_SECONDS = REGISTRY.histogram('sportyscores_espn_request_seconds', 'ESPN scoreboard request latency including body decode', ('league',))
+SCORES_LOOKUPS = REGISTRY.counter(
+    'sportyscores_scores_lookups_total', 'fetch_scores calls by how they were served (hit, shared, fetched, stale, failed)', ('league', 'result')
+)
+HISTORY_LOOKUPS = REGISTRY.counter(
+    'sportyscores_history_lookups_total', 'Dated scoreboard lookups by how they were served (archived, fetched, failed)', ('league', 'result')
+)
+SUMMARY_LOOKUPS = REGISTRY.counter(
+    'sportyscores_summary_lookups_total', 'Game summary lookups by how they were served (hit, shared, archived, fetched, stale, failed)', ('league', 'result')
+)
+PARSE_SECONDS = REGISTRY.histogram('sportyscores_parse_seconds', 'Time to turn a scoreboard into Game objects (reused parses are not timed)', ('league',))
+
+def decode_scoreboard(body: bytes, selective: bool = SCORES_SELECTIVE_DECODE) -> Dict:
+    data = json_loads(body)
+    if not selective or not isinstance(data, dict):
+        return data
+    
+    # Keep only what parse_games reads so news, leaders and league metadata can be freed right away
+    events = []
+    for event in data.get('events', []):
+        competitions = event.get('competitions')
+        if not competitions:
+            continue
+        competition = competitions[0]
+        slim_competition = {k: competition[k] for k in COMPETITION_KEYS if k in competition}
+        slim_competition['competitors'] = [
+            {k: c[k] for k in COMPETITOR_KEYS if k in c}
+            for c in competition.get('competitors', [])
+        ]
+        slim_event = {k: event[k] for k in EVENT_KEYS if k in event}
+        slim_event['competitions'] = [slim_competition]
+        events.append(slim_event)
+    return {'events': events}
+
+def espn_today() -> date:
+    # ESPN's scoreboard days roll over on US Eastern time, not at UTC midnight
+    return datetime.now(ESPN_TZ).date()
+
+def decode_summary(body: bytes) -> Dict:
+    data = json_loads(body)
+    if not isinstance(data, dict):
+        return data
+    # Play-by-play, per-player box scores, news and videos make up most of a summary and are never shown
+    boxscore = data.get('boxscore', {})
+    return {
+        'boxscore': {'teams': boxscore.get('teams', [])},
+        'leaders': data.get('leaders', [])
+    }
 
 class SportsAPI:
-    def __init__(self):
+    def __init__(self, cache_ttl: float = SCORES_CACHE_TTL, base_url: str = ESPN_API_BASE, recorder=None, archive=None):
         self.session: Optional[aiohttp.ClientSession] = None
+        self.base_url = base_url
+        self.cache_ttl = cache_ttl
+        # Replay swaps in a virtual clock so cache ages follow the recording instead of the wall
+        self.clock: Callable[[], float] = time.monotonic
+        # Optional recording.SnapshotRecorder that keeps every new scoreboard for later replay
+        self.recorder = recorder
+        # Optional scoreboard_archive.ScoreboardArchive holding finished past days forever
+        self.archive = archive
+        self._cache: Dict[str, Tuple[float, Dict]] = {}
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._validators: Dict[str, Dict[str, str]] = {}
+        self._last_data: Dict[str, Dict] = {}
+        self._parsed: Dict[str, Tuple[Dict, List[Game]]] = {}
+        self._feeds: Dict[str, LeagueFeed] = {}
+        self._indexes: Dict[str, Tuple[Dict, TeamIndex]] = {}
+        # League rosters barely change during a season, so they are kept for the life of the process
+        self._teams: Dict[str, List[Dict]] = {}
+        # game id -> (fetched at, scoreboard fingerprint it was fetched for, final, summary), least recently used first
+        self._summaries: OrderedDict[str, Tuple[float, str, bool, Dict]] = OrderedDict()
+        self._summary_inflight: Dict[str, asyncio.Task] = {}
     
     async def create_session(self):
         if self.session is None:
-            self.session = aiohttp.ClientSession()
+            connector = aiohttp.TCPConnector(
+                limit=HTTP_POOL_LIMIT,
+                limit_per_host=HTTP_POOL_LIMIT_PER_HOST,
+                keepalive_timeout=HTTP_KEEPALIVE_TIMEOUT,
+                ttl_dns_cache=HTTP_DNS_CACHE_TTL,
+                use_dns_cache=True
+            )
+            timeout = aiohttp.ClientTimeout(
+                total=HTTP_TOTAL_TIMEOUT,
+                sock_connect=HTTP_CONNECT_TIMEOUT,
+                sock_read=HTTP_READ_TIMEOUT
+            )
+            self.session = aiohttp.ClientSession(connector=connector, timeout=timeout)
     
     async def close_session(self):
         if self.session:
             await self.session.close()
             self.session = None
     
-    async def fetch_scores(self, league: str) -> Optional[Dict]:
-        if league not in ESPN_API_URLS:
+    async def fetch_scores(self, league: str, max_age: Optional[float] = None) -> Optional[Dict]:
+        if league not in LEAGUES:
             return None
         
-        await self.create_session()
+        ttl = self.cache_ttl if max_age is None else max_age
+        cached = self._cache.get(league)
+        if cached and self.clock() - cached[0] < ttl:
+            SCORES_LOOKUPS.labels(league, 'hit').inc()
+            return cached[1]
         
-        try:
-            async with self.session.get(ESPN_API_URLS[league]) as response:
-                if response.status == 200:
-                    return await response.json()
+        task = self._inflight.get(league)
+        if task is None:
+            task = asyncio.create_task(self._refresh_scores(league))
+            self._inflight[league] = task
+            task.add_done_callback(lambda t: self._release_inflight(league, t))
+        else:
+            SCORES_LOOKUPS.labels(league, 'shared').inc()
+        
+        # Shield so one cancelled caller does not abort the request others are waiting on
+        return await asyncio.shield(task)
+    
+    def _release_inflight(self, league: str, task: asyncio.Task):
+        if self._inflight.get(league) is task:
+            del self._inflight[league]
+    
+    async def _refresh_scores(self, league: str) -> Optional[Dict]:
+        data = await self._request_scores(league)
+        cached = self._cache.get(league)
+        if data is not None:
+            SCORES_LOOKUPS.labels(league, 'fetched').inc()
+            # A 304 hands back the previous object, which is already in the recording
+            if self.recorder and (cached is None or cached[1] is not data):
+                self.recorder.record(league, data)
+            self._cache[league] = (self.clock(), data)
+            self._publish(league, data)
+            return data
+        
+        if cached:
+            SCORES_LOOKUPS.labels(league, 'stale').inc()
+            age = self.clock() - cached[0]
+            print(f"Serving cached {league.upper()} scores ({age:.0f}s old)")
+            return cached[1]
+        SCORES_LOOKUPS.labels(league, 'failed').inc()
+        return None
+    
+    def cached_team_index(self, league: str) -> Optional[TeamIndex]:
+        # Memory only, never a request, so autocomplete can call it on every keystroke
+        cached = self._cache.get(league)
+        if cached is None:
+            return None
+        data = cached[1]
+        index = self._indexes.get(league)
+        if index is None or index[0] is not data:
+            # Rebuilt at most once per scoreboard refresh, from the memoized parse
+            index = (data, TeamIndex(self.parse_games(data, league)))
+            self._indexes[league] = index
+        return index[1]
+    
+    async def team_index(self, league: str) -> Optional[TeamIndex]:
+        # Commands resolve against a scoreboard no older than cache_ttl, so yesterday's slate is never matched;
+        # within the TTL this is a cache hit, and past it a conditional request
+        await self.fetch_scores(league)
+        return self.cached_team_index(league)
+    
+    async def fetch_teams(self, league: str) -> Optional[List[Dict]]:
+        if league not in LEAGUES:
+            return None
+        if league not in self._teams:
+            teams = await self._request_teams(league)
+            if teams is None:
                 return None
-        except Exception as e:
-            print(f"Error fetching {league.upper()} scores: {e}")
+            self._teams[league] = teams
+        return self._teams[league]
+    
+    async def team_directory(self, league: str) -> Optional[TeamDirectory]:
+        teams = await self.fetch_teams(league)
+        if teams is None:
+            # Without the team list only teams on the current scoreboard can be found
+            data = await self.fetch_scores(league)
+            if not data:
+                return None
+            teams = [competitor['team'] for game in self.parse_games(data, league) for competitor in (game.away, game.home)]
+        return TeamDirectory(teams)
+    
+    async def fetch_summary(self, league: str, game_id: str, version: str = '', completed: bool = False) -> Optional[Dict]:
+        # version is the fingerprint of the game's scoreboard state; the summary only changes when it does
+        if league not in LEAGUES:
             return None
+        cached = self._summaries.get(game_id)
+        if cached:
+            fetched_at, cached_version, final, data = cached
+            age = self.clock() - fetched_at
+            interval = SUMMARY_LIVE_INTERVAL if cached_version != version else SUMMARY_IDLE_TTL
+            # The first lookup after the final whistle always refetches, so the kept copy has the final stats
+            if final or (age < interval and not completed):
+                self._summaries.move_to_end(game_id)
+                SUMMARY_LOOKUPS.labels(league, 'hit').inc()
+                return data
+        
+        task = self._summary_inflight.get(game_id)
+        if task is None:
+            task = asyncio.create_task(self._refresh_summary(league, game_id, version, completed))
+            self._summary_inflight[game_id] = task
+            task.add_done_callback(lambda t: self._release_summary(game_id, t))
+        else:
+            SUMMARY_LOOKUPS.labels(league, 'shared').inc()
+        return await asyncio.shield(task)
+    
+    def _release_summary(self, game_id: str, task: asyncio.Task):
+        if self._summary_inflight.get(game_id) is task:
+            del self._summary_inflight[game_id]
+    
+    async def _refresh_summary(self, league: str, game_id: str, version: str, completed: bool) -> Optional[Dict]:
+        data = None
+        if completed and self.archive:
+            data = await self.archive.get_summary(league, game_id)
+            if data is not None:
+                SUMMARY_LOOKUPS.labels(league, 'archived').inc()
+        if data is None:
+            data = await self._request_summary(league, game_id, version, completed)
+            if data is not None:
+                SUMMARY_LOOKUPS.labels(league, 'fetched').inc()
+                # A finished game's summary never changes again, so it is kept on disk for good
+                if completed and self.archive:
+                    await self.archive.put_summary(league, game_id, data)
+        
+        if data is None:
+            cached = self._summaries.get(game_id)
+            SUMMARY_LOOKUPS.labels(league, 'stale' if cached else 'failed').inc()
+            return cached[3] if cached else None
+        
+        self._summaries[game_id] = (self.clock(), version, completed, data)
+        self._summaries.move_to_end(game_id)
+        while len(self._summaries) > SUMMARY_CACHE_SIZE:
+            self._summaries.popitem(last=False)
+        return data
+    
+    def subscribe(self, league: str, queue_size: int = WATCH_QUEUE_SIZE) -> EventQueue:
+        if league not in LEAGUES:
+            raise ValueError(f"Unsupported league: {league}")
+        feed = self._feeds.get(league)
+        if feed is None:
+            feed = self._feeds[league] = LeagueFeed(league)
+        queue = EventQueue(league, queue_size)
+        feed.subscribers.add(queue)
+        # One poller per league no matter how many subscribers; it stops with the last one
+        if feed.task is None:
+            feed.task = asyncio.create_task(self._poll_feed(feed))
+        return queue
+    
+    def unsubscribe(self, queue: EventQueue):
+        queue.close()
+        feed = self._feeds.get(queue.league)
+        if feed is None:
+            return
+        feed.subscribers.discard(queue)
+        if not feed.subscribers:
+            feed.close()
+            del self._feeds[queue.league]
+    
+    async def watch(self, league: str, queue_size: int = WATCH_QUEUE_SIZE) -> AsyncIterator[GameEvent]:
+        queue = self.subscribe(league, queue_size)
+        try:
+            async for event in queue:
+                yield event
+        finally:
+            self.unsubscribe(queue)
+    
+    async def _poll_feed(self, feed: LeagueFeed):
+        while feed.subscribers:
+            try:
+                # Shares the TTL cache and in-flight requests, so a league the update loop
+                # already polls costs the feed nothing extra
+                data = await self.fetch_scores(feed.league, max_age=POLL_TICK)
+                if data:
+                    self._publish(feed.league, data)
+            except Exception as e:
+                print(f"Error polling {feed.league.upper()} for watchers: {e}")
+            await asyncio.sleep(feed.poll_interval())
+    
+    def _publish(self, league: str, data: Dict):
+        feed = self._feeds.get(league)
+        if feed is not None:
+            feed.publish(data, self.parse_games(data, league))
     
-    def parse_games(self, data: Dict, league: str) -> List[Dict]:
+    async def fetch_many(self, leagues: Iterable[str], max_concurrency: int = FETCH_CONCURRENCY) -> AsyncIterator[Tuple[str, Optional[Dict]]]:
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def fetch(league: str) -> Tuple[str, Optional[Dict]]:
+            async with semaphore:
+                try:
+                    return league, await self.fetch_scores(league)
+                except Exception as e:
+                    # One league failing must not take the others down with it
+                    print(f"Error fetching {league.upper()} scores: {e}")
+                    return league, None
+        
+        tasks = [asyncio.create_task(fetch(league)) for league in leagues]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+    
+    async def fetch_scores_on(self, league: str, day: date) -> Optional[Dict]:
+        if league not in LEAGUES:
+            return None
+        today = espn_today()
+        if day == today:
+            return await self.fetch_scores(league)
+        
+        if self.archive and day < today:
+            data = await self.archive.get(league, day)
+            if data is not None:
+                HISTORY_LOOKUPS.labels(league, 'archived').inc()
+                return data
+        
+        data = await self._request_scores(league, day)
+        if data is None:
+            HISTORY_LOOKUPS.labels(league, 'failed').inc()
+            return None
+        HISTORY_LOOKUPS.labels(league, 'fetched').inc()
+        # A past day with every game final never changes again; anything else (suspended games) is refetched next time
+        if self.archive and day < today and is_final(data):
+            await self.archive.put(league, day, data)
+        return data
+    
+    async def fetch_dates(self, league: str, days: Iterable[date], max_concurrency: int = FETCH_CONCURRENCY) -> List[Tuple[date, Optional[Dict]]]:
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def fetch(day: date) -> Tuple[date, Optional[Dict]]:
+            async with semaphore:
+                try:
+                    return day, await self.fetch_scores_on(league, day)
+                except Exception as e:
+                    print(f"Error fetching {league.upper()} scores for {day}: {e}")
+                    return day, None
+        
+        return list(await asyncio.gather(*(fetch(day) for day in days)))
+    
+    def invalidate(self, league: Optional[str] = None):
+        if league is None:
+            self._cache.clear()
+            self._validators.clear()
+            self._last_data.clear()
+        else:
+            self._cache.pop(league, None)
+            self._validators.pop(league, None)
+            self._last_data.pop(league, None)
+    
+    async def _request_scores(self, league: str, day: Optional[date] = None) -> Optional[Dict]:
+        await self.create_session()
+        
+        headers = {'Accept-Encoding': ACCEPT_ENCODING}
+        params = {'dates': day.strftime('%Y%m%d')} if day else None
+        validators = self._validators.get(league, {})
+        # Conditional requests and the 304 fallback only track today's scoreboard
+        if day is None and league in self._last_data:
+            if validators.get('etag'):
+                headers['If-None-Match'] = validators['etag']
+            if validators.get('last_modified'):
+                headers['If-Modified-Since'] = validators['last_modified']
+        
+        latency = ESPN_REQUEST_SECONDS.labels(league)
+        for attempt in range(HTTP_MAX_RETRIES + 1):
+            status = 'error'
+            start = time.perf_counter()
+            try:
+                async with self.session.get(LEAGUES[league].endpoint(self.base_url), headers=headers, params=params) as response:
+                    status = str(response.status)
+                    if response.status == 304 and day is None and league in self._last_data:
+                        return self._last_data[league]
+                    if response.status == 200:
+                        data = decode_scoreboard(await response.read())
+                        if day:
+                            return data
+                        self._validators[league] = {
+                            'etag': response.headers.get('ETag', ''),
+                            'last_modified': response.headers.get('Last-Modified', '')
+                        }
+                        self._last_data[league] = data
+                        return data
+                    if response.status != 429 and response.status < 500:
+                        return None
+                    error = f"HTTP {response.status}"
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                error = str(e) or type(e).__name__
+            except Exception as e:
+                print(f"Error fetching {league.upper()} scores: {e}")
+                return None
+            finally:
+                latency.observe(time.perf_counter() - start)
+                ESPN_REQUESTS.labels(league, status).inc()
+            
+            if attempt < HTTP_MAX_RETRIES:
+                await asyncio.sleep(self._backoff_delay(attempt))
+        
+        print(f"Error fetching {league.upper()} scores after {HTTP_MAX_RETRIES + 1} attempt(s): {error}")
+        return None
+    
+    async def _request_teams(self, league: str) -> Optional[List[Dict]]:
+        await self.create_session()
+        try:
+            async with self.session.get(LEAGUES[league].endpoint(self.base_url, 'teams'), headers={'Accept-Encoding': ACCEPT_ENCODING}) as response:
+                ESPN_REQUESTS.labels(league, str(response.status)).inc()
+                if response.status != 200:
+                    print(f"Error fetching {league.upper()} teams: HTTP {response.status}")
+                    return None
+                data = json_loads(await response.read())
+            return [entry['team'] for entry in data['sports'][0]['leagues'][0]['teams']]
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            ESPN_REQUESTS.labels(league, 'error').inc()
+            print(f"Error fetching {league.upper()} teams: {str(e) or type(e).__name__}")
+        except (KeyError, IndexError, TypeError, ValueError) as e:
+            print(f"Error parsing {league.upper()} teams: {e}")
+        return None
+    
+    async def _request_summary(self, league: str, game_id: str, version: str = '', completed: bool = False) -> Optional[Dict]:
+        await self.create_session()
+        url = LEAGUES[league].endpoint(self.base_url, 'summary')
+        try:
+            async with self.session.get(url, params={'event': game_id}, headers={'Accept-Encoding': ACCEPT_ENCODING}) as response:
+                ESPN_REQUESTS.labels(league, str(response.status)).inc()
+                if response.status != 200:
+                    print(f"Error fetching {league.upper()} summary for game {game_id}: HTTP {response.status}")
+                    return None
+                return decode_summary(await response.read())
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            ESPN_REQUESTS.labels(league, 'error').inc()
+            print(f"Error fetching {league.upper()} summary for game {game_id}: {str(e) or type(e).__name__}")
+        except ValueError as e:
+            print(f"Error parsing {league.upper()} summary for game {game_id}: {e}")
+        return None
+    
+    @staticmethod
+    def _backoff_delay(attempt: int) -> float:
+        # Full jitter keeps retries from several leagues from landing on ESPN at the same instant
+        return random.uniform(0, min(HTTP_BACKOFF_MAX, HTTP_BACKOFF_BASE * (2 ** attempt)))
+    
+    def parse_games(self, data: Dict, league: str, memoize: bool = True) -> List[Game]:
         if not data or 'events' not in data:
             return []
         
+        # Unchanged (cached or 304) scoreboards come back as the same object, so reuse the last parse
+        parsed = self._parsed.get(league)
+        if parsed and parsed[0] is data:
+            return list(parsed[1])
+        
+        with PARSE_SECONDS.labels(league).time():
+            games = self._parse_events(data, league)
+        # Past days pass memoize=False so they do not evict the live scoreboard's parse
+        if memoize:
+            self._parsed[league] = (data, games)
+        return list(games)
+    
+    def _parse_events(self, data: Dict, league: str) -> List[Game]:
         games = []
         for event in data['events']:
             try:
@@ -47,58 +510,35 @@ class SportsAPI:
                 if not home_team or not away_team:
                     continue
                 
-                linescores_home = home_team.get('linescores', [])
-                linescores_away = away_team.get('linescores', [])
-                
-                venue = competition.get('venue', {})
-                venue_name = venue.get('fullName', 'TBD')
-                
-                broadcast = competition.get('broadcasts', [{}])[0].get('names', ['Not Available'])[0] if competition.get('broadcasts') else 'Not Available'
-                
-                odds = competition.get('odds', [{}])[0] if competition.get('odds') else {}
-                
-                home_stats = home_team.get('statistics', [])
-                away_stats = away_team.get('statistics', [])
-                
-                situation = competition.get('situation', {})
+                status_type = status['type']
+                home = home_team['team']
+                away = away_team['team']
                 
-                game_info = {
-                    'id': event['id'],
-                    'league': league,
-                    'name': event.get('name', ''),
-                    'short_name': event.get('shortName', ''),
-                    'home_team': home_team['team']['displayName'],
-                    'away_team': away_team['team']['displayName'],
-                    'home_team_id': home_team['team'].get('id', ''),
-                    'away_team_id': away_team['team'].get('id', ''),
-                    'home_team_abbr': home_team['team'].get('abbreviation', ''),
-                    'away_team_abbr': away_team['team'].get('abbreviation', ''),
-                    'home_team_logo': home_team['team'].get('logo', ''),
-                    'away_team_logo': away_team['team'].get('logo', ''),
-                    'home_team_color': home_team['team'].get('color', '000000'),
-                    'away_team_color': away_team['team'].get('color', '000000'),
-                    'home_score': home_team['score'],
-                    'away_score': away_team['score'],
-                    'home_linescores': linescores_home,
-                    'away_linescores': linescores_away,
-                    'status': status['type']['description'],
-                    'detail': status['type']['detail'],
-                    'completed': status['type']['completed'],
-                    'period': status.get('period', 0),
-                    'clock': status.get('displayClock', ''),
-                    'home_record': home_team.get('records', [{}])[0].get('summary', ''),
-                    'away_record': away_team.get('records', [{}])[0].get('summary', ''),
-                    'venue': venue_name,
-                    'broadcast': broadcast,
-                    'odds_details': odds.get('details', ''),
-                    'overunder': odds.get('overUnder', ''),
-                    'home_stats': home_stats,
-                    'away_stats': away_stats,
-                    'situation': situation,
-                    'attendance': competition.get('attendance', 0)
-                }
+                game = Game(
+                    id=event['id'],
+                    league=league,
+                    home_team=home['displayName'],
+                    away_team=away['displayName'],
+                    home_team_id=home.get('id', ''),
+                    away_team_id=away.get('id', ''),
+                    home_team_abbr=home.get('abbreviation', ''),
+                    away_team_abbr=away.get('abbreviation', ''),
+                    home_team_color=home.get('color', '000000'),
+                    home_score=home_team['score'],
+                    away_score=away_team['score'],
+                    detail=status_type['detail'],
+                    completed=status_type['completed'],
+                    period=status.get('period', 0),
+                    clock=status.get('displayClock', ''),
+                    home_record=home_team.get('records', [{}])[0].get('summary', ''),
+                    away_record=away_team.get('records', [{}])[0].get('summary', ''),
+                    event=event,
+                    competition=competition,
+                    home=home_team,
+                    away=away_team
+                )
                 
-                games.append(game_info)
+                games.append(game)
             except (KeyError, IndexError) as e:
                 print(f"Error parsing game data: {e}")
                 continue
@@ -0,0 +1,92 @@
+import bisect
+import difflib
+import re
+from typing import Dict, Iterable, List, Set
+from models import Game
+
+FUZZY_CUTOFF = 0.75
+TEAM_NAME_KEYS = ('displayName', 'shortDisplayName', 'name', 'nickname', 'location', 'abbreviation')
+
+def normalize(text: str) -> str:
+    return ' '.join(re.sub(r'[^a-z0-9 ]', ' ', text.lower()).split())
+
+def team_keys(team: Dict) -> Set[str]:
+    return {normalize(team[key]) for key in TEAM_NAME_KEYS if team.get(key)}
+
+def match_keys(keys: Dict[str, Set[str]], sorted_keys: List[str], query: str) -> Set[str]:
+    query = normalize(query)
+    if not query:
+        return set()
+    if query in keys:
+        return set(keys[query])
+    
+    # Prefixes ("kan", "new york") come from a bisect over the sorted names
+    matches: Set[str] = set()
+    for position in range(bisect.bisect_left(sorted_keys, query), len(sorted_keys)):
+        key = sorted_keys[position]
+        if not key.startswith(query):
+            break
+        matches |= keys[key]
+    if matches:
+        return matches
+    
+    # Last resort for typos like "cheifs"
+    for key in difflib.get_close_matches(query, sorted_keys, n=5, cutoff=FUZZY_CUTOFF):
+        matches |= keys[key]
+    return matches
+
+class TeamIndex:
+    def __init__(self, games: Iterable[Game]):
+        self.games: Dict[str, Game] = {}
+        self._keys: Dict[str, Set[str]] = {}
+        for game in games:
+            self.games[game.id] = game
+            for competitor in (game.away, game.home):
+                for key in team_keys(competitor.get('team', {})):
+                    self._keys.setdefault(key, set()).add(game.id)
+        # Scoreboard order decides ties, matching the numbering !games shows
+        self._order = {game_id: position for position, game_id in enumerate(self.games)}
+        self._sorted_keys = sorted(self._keys)
+    
+    def __len__(self) -> int:
+        return len(self.games)
+    
+    def search(self, query: str) -> List[Game]:
+        game_ids = match_keys(self._keys, self._sorted_keys, query)
+        return [self.games[game_id] for game_id in sorted(game_ids, key=self._order.__getitem__)]
+    
+    def resolve(self, query: str) -> List[Game]:
+        query = query.strip()
+        # Autocomplete submits game ids; plain small numbers are positions from !games
+        if query in self.games:
+            return [self.games[query]]
+        if query.isdigit():
+            position = int(query)
+            if 1 <= position <= len(self.games):
+                return [list(self.games.values())[position - 1]]
+            return []
+        return self.search(query)
+    
+    def suggest(self, query: str, limit: int = 25) -> List[Game]:
+        games = self.search(query) if normalize(query) else list(self.games.values())
+        return games[:limit]
+
+class TeamDirectory:
+    # Every team in a league, not just those playing today, for follows
+    def __init__(self, teams: Iterable[Dict]):
+        self.teams: Dict[str, Dict] = {}
+        self._keys: Dict[str, Set[str]] = {}
+        for team in teams:
+            if not team.get('id'):
+                continue
+            self.teams[team['id']] = team
+            for key in team_keys(team):
+                self._keys.setdefault(key, set()).add(team['id'])
+        self._sorted_keys = sorted(self._keys)
+    
+    def __len__(self) -> int:
+        return len(self.teams)
+    
+    def search(self, query: str) -> List[Dict]:
+        team_ids = match_keys(self._keys, self._sorted_keys, query)
+        return sorted((self.teams[team_id] for team_id in team_ids), key=lambda team: team.get('displayName', ''))
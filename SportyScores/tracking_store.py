@@ -0,0 +1,131 @@
+import asyncio
+import sqlite3
+from typing import Dict, List, Optional, Tuple
+from config import TRACKING_DB_PATH
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS tracked_games (
+    game_id TEXT NOT NULL,
+    message_id INTEGER NOT NULL,
+    channel_id INTEGER NOT NULL,
+    guild_id INTEGER,
+    slot INTEGER NOT NULL DEFAULT 0,
+    league TEXT NOT NULL,
+    fingerprint TEXT,
+    detailed INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (game_id, message_id)
+)
+'''
+
+FOLLOWS_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS follows (
+    league TEXT NOT NULL,
+    team_id TEXT NOT NULL,
+    channel_id INTEGER NOT NULL,
+    guild_id INTEGER,
+    team_name TEXT NOT NULL,
+    PRIMARY KEY (league, team_id, channel_id)
+)
+'''
+
+class TrackingStore:
+    def __init__(self, path: str = TRACKING_DB_PATH):
+        self.path = path
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.execute(SCHEMA)
+        self.conn.execute(FOLLOWS_SCHEMA)
+        columns = {row[1] for row in self.conn.execute('PRAGMA table_info(tracked_games)')}
+        if 'guild_id' not in columns:
+            self.conn.execute('ALTER TABLE tracked_games ADD COLUMN guild_id INTEGER')
+        if 'slot' not in columns:
+            self.conn.execute('ALTER TABLE tracked_games ADD COLUMN slot INTEGER NOT NULL DEFAULT 0')
+        if 'detailed' not in columns:
+            self.conn.execute('ALTER TABLE tracked_games ADD COLUMN detailed INTEGER NOT NULL DEFAULT 0')
+        self.conn.commit()
+        # Writes are buffered here and applied in one transaction per flush
+        self._upserts: Dict[Tuple[str, int], Tuple] = {}
+        self._deletes: Dict[Tuple[str, int], None] = {}
+        self._lock = asyncio.Lock()
+    
+    def upsert(self, game_id: str, message_id: int, channel_id: int, guild_id: Optional[int], slot: int, league: str,
+               fingerprint: Optional[str], detailed: bool = False):
+        self._upserts[(game_id, message_id)] = (game_id, message_id, channel_id, guild_id, slot, league, fingerprint, int(detailed))
+    
+    def delete(self, game_id: str, message_id: int):
+        self._upserts.pop((game_id, message_id), None)
+        self._deletes[(game_id, message_id)] = None
+    
+    @property
+    def pending(self) -> int:
+        return len(self._upserts) + len(self._deletes)
+    
+    def load(self) -> List[Dict]:
+        rows = self.conn.execute(
+            'SELECT game_id, message_id, channel_id, guild_id, slot, league, fingerprint, detailed FROM tracked_games'
+        ).fetchall()
+        return [
+            {
+                'game_id': r[0], 'message_id': r[1], 'channel_id': r[2], 'guild_id': r[3],
+                'slot': r[4], 'league': r[5], 'fingerprint': r[6], 'detailed': bool(r[7])
+            }
+            for r in rows
+        ]
+    
+    # Follows change only on user commands, so they are written straight through rather than buffered
+    def save_follow(self, league: str, team_id: str, channel_id: int, guild_id: Optional[int], team_name: str):
+        with self.conn:
+            self.conn.execute(
+                'INSERT OR REPLACE INTO follows (league, team_id, channel_id, guild_id, team_name) VALUES (?, ?, ?, ?, ?)',
+                (league, team_id, channel_id, guild_id, team_name)
+            )
+    
+    def delete_follow(self, league: str, team_id: str, channel_id: int):
+        with self.conn:
+            self.conn.execute('DELETE FROM follows WHERE league = ? AND team_id = ? AND channel_id = ?', (league, team_id, channel_id))
+    
+    def load_follows(self) -> List[Dict]:
+        rows = self.conn.execute('SELECT league, team_id, channel_id, guild_id, team_name FROM follows').fetchall()
+        return [
+            {'league': r[0], 'team_id': r[1], 'channel_id': r[2], 'guild_id': r[3], 'team_name': r[4]}
+            for r in rows
+        ]
+    
+    def _take_pending(self) -> Tuple[List[Tuple], List[Tuple]]:
+        deletes = list(self._deletes)
+        upserts = list(self._upserts.values())
+        self._deletes = {}
+        self._upserts = {}
+        return deletes, upserts
+    
+    def _write(self, deletes: List[Tuple], upserts: List[Tuple]):
+        # Deletes go first so a game removed and re-tracked in the same batch keeps its new row
+        with self.conn:
+            self.conn.executemany('DELETE FROM tracked_games WHERE game_id = ? AND message_id = ?', deletes)
+            self.conn.executemany(
+                'INSERT INTO tracked_games (game_id, message_id, channel_id, guild_id, slot, league, fingerprint, detailed) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?, ?) '
+                'ON CONFLICT (game_id, message_id) DO UPDATE SET '
+                'channel_id = excluded.channel_id, guild_id = excluded.guild_id, slot = excluded.slot, '
+                'league = excluded.league, fingerprint = excluded.fingerprint, detailed = excluded.detailed',
+                upserts
+            )
+    
+    def flush_sync(self):
+        if self.pending:
+            self._write(*self._take_pending())
+    
+    async def flush(self):
+        if not self.pending:
+            return
+        async with self._lock:
+            deletes, upserts = self._take_pending()
+            try:
+                await asyncio.to_thread(self._write, deletes, upserts)
+            except sqlite3.Error as e:
+                print(f"Error saving tracked games: {e}")
+    
+    def close(self):
+        self.flush_sync()
+        self.conn.close()